@@ -0,0 +1,54 @@
+"""
+Configuração do gunicorn para a Lisa.
+
+Carrega a aplicação (modelo do spaCy e índices léxicos) no processo mestre
+antes do fork (preload_app), de forma que os workers compartilhem essas
+páginas de memória via copy-on-write. O uso de memória de cada worker é
+registrado na inicialização: uma parcela compartilhada alta e uma memória
+privada baixa indicam que o preload está sendo aproveitado.
+
+Uso:
+    gunicorn -c lisa/gunicorn_config.py lisa.wsgi:application
+"""
+import os
+import gc
+
+bind = os.environ.get('GUNICORN_BIND', ':2154')
+workers = int(os.environ.get('GUNICORN_WORKERS', 3))
+preload_app = True
+
+# Habilita o carregamento do spaCy no boot da aplicação WSGI (lisa/wsgi.py)
+os.environ.setdefault('LISA_PRELOAD', '1')
+
+
+def _format_memory(usage):
+    mib = {name: (value or 0) / 2**20 for name, value in usage.items()}
+    if usage['pss'] is None:
+        return f'max RSS {mib["rss"]:.1f} MiB'
+    return (f'RSS {mib["rss"]:.1f} MiB, PSS {mib["pss"]:.1f} MiB '
+            f'(shared {mib["shared"]:.1f} MiB, private {mib["private"]:.1f} MiB)')
+
+
+def when_ready(server):
+    """
+    Executado no mestre após o preload, antes do fork dos workers.
+    """
+    from lisa_processing.util.tools import get_memory_usage
+
+    # Evita que a coleta de lixo dos workers toque (e copie) as páginas
+    # dos objetos pré-carregados
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+
+    server.log.info('Master %s: %s', os.getpid(),
+                    _format_memory(get_memory_usage()))
+
+
+def post_worker_init(worker):
+    """
+    Registra o uso de memória de cada worker após sua inicialização.
+    """
+    from lisa_processing.util.tools import get_memory_usage
+
+    worker.log.info('Worker %s: %s', worker.pid,
+                    _format_memory(get_memory_usage()))
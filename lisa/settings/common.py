@@ -67,6 +67,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'lisa_processing.middleware.RequestCacheMiddleware',
 ]
 
 ROOT_URLCONF = 'lisa.urls'
@@ -135,8 +136,52 @@ GRAPHENE = {
 CORPORA_PATH = {
     'hateset': 'corpora/lexical_data/hateset.txt',
     'sentilex_lem': 'corpora/lexical_data/SentiLex-lem-PT02.txt',
+    'modifiers': 'corpora/lexical_data/modifiers.txt',
+    'motivational': 'corpora/lexical_data/motivational_data.txt',
 }
 
+# Artefato binário gerado por `manage.py compile_lexicon`
+LEXICON_ARTIFACT_PATH = 'corpora/compiled/lexicon.bin'
+
+# Número máximo de radicais memorizados pelo serviço de stemming
+STEMMER_CACHE_SIZE = 65536
+
+# Execução da extração de sentimentos em lote: com PARALLEL habilitado, lotes
+# com ao menos THRESHOLD textos são fragmentados em blocos de CHUNK_SIZE
+# textos entre WORKERS processos (None = número de CPUs)
+SENTIMENT_BATCH = {
+    'PARALLEL': False,
+    'WORKERS': None,
+    'CHUNK_SIZE': 2000,
+    'THRESHOLD': 10000,
+}
+
+# Número de textos pontuados por bloco no endpoint de streaming /stream/
+STREAM_CHUNK_SIZE = 256
+
+# Docs do spaCy são reaproveitados entre os resolvers de uma mesma requisição;
+# um valor maior que zero habilita também um cache LRU no processo
+SPACY_DOC_CACHE_SIZE = 0
+
+# Modelo do spaCy, carregado no primeiro uso ou, com SPACY_EAGER_LOAD, no
+# boot da aplicação WSGI (habilitado pela configuração do gunicorn)
+SPACY_MODEL = 'pt'
+SPACY_EAGER_LOAD = os.environ.get('LISA_PRELOAD', '') == '1'
+
+# Processamento em lote de textos com o spaCy (nlp.pipe)
+SPACY_PIPE = {
+    'BATCH_SIZE': 64,
+    'N_PROCESS': 1,
+}
+
+# Arquivo opcional de stop words customizadas da implantação: uma palavra por
+# linha, prefixada com "+" (adição, padrão) ou "-" (remoção)
+STOPWORDS_CUSTOM_PATH = os.environ.get('STOPWORDS_CUSTOM_PATH')
+
+# Número máximo de vetores normalizados de textos memorizados pelo serviço
+# de similaridade
+SIMILARITY_VECTOR_CACHE_SIZE = 1024
+
 # Logging settings
 LOGGING = {
     'version': 1,
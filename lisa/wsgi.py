@@ -9,8 +9,16 @@ https://docs.djangoproject.com/en/2.1/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'lisa.settings')
 
 application = get_wsgi_application()
+
+# Carrega os índices léxicos (e o modelo do spaCy, se configurado) antes de
+# atender a primeira requisição; com o preload_app do gunicorn, isso ocorre
+# antes do fork e os workers compartilham a memória via copy-on-write
+from lisa_processing.util.preload import preload  # noqa: E402
+
+preload(language_model=settings.SPACY_EAGER_LOAD)
@@ -56,3 +56,20 @@ class Reducers(Enum):
     """
     STEMMING = 'stemmer'
     LEMMING = 'lemmer'
+
+
+class SimilaritySource(Enum):
+    """
+    Índices de busca disponíveis para a consulta de termos mais similares.
+    """
+    CORPUS = 'corpus'
+    VOCABULARY = 'vocabulary'
+
+
+class VectorFormat(Enum):
+    """
+    Formatos de serialização dos vetores dos tokens.
+    """
+    LIST = 'list'
+    FLOAT16 = 'float16'
+    FLOAT32 = 'float32'
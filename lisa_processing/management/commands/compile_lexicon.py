@@ -0,0 +1,38 @@
+"""
+Compila os corpora léxicos em um artefato binário carregado via mmap.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from lisa_processing.util.compiled_lexicon import FORMAT_VERSION, write_artifact
+from lisa_processing.util.lexicon import (build_hateset_index,
+                                          build_polarity_index)
+from lisa_processing.util.offense import build_expression_table
+
+
+class Command(BaseCommand):
+    help = 'Compiles the lexical corpora into a binary artifact shared by the workers.'
+    requires_system_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=settings.LEXICON_ARTIFACT_PATH,
+            help='Artifact destination path.'
+        )
+
+    def handle(self, *args, **options):
+        sentilex = settings.CORPORA_PATH['sentilex_lem']
+        hateset = settings.CORPORA_PATH['hateset']
+
+        tables = {
+            'polarity': (sentilex, build_polarity_index(sentilex)),
+            'hateset': (hateset, dict.fromkeys(build_hateset_index(hateset), 1)),
+            'expressions': (hateset, build_expression_table(hateset)),
+        }
+        write_artifact(options['output'], tables)
+
+        for name, (_, data) in tables.items():
+            self.stdout.write(f'{name}: {len(data)} stems')
+        self.stdout.write(self.style.SUCCESS(
+            f'Lexicon artifact v{FORMAT_VERSION} written to {options["output"]}'
+        ))
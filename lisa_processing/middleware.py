@@ -0,0 +1,20 @@
+"""
+Middlewares da aplicação.
+"""
+from lisa_processing.util import request_cache
+
+
+class RequestCacheMiddleware:
+    """
+    Mantém um cache com escopo de requisição, compartilhado pelos resolvers
+    de uma mesma query.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_cache.activate()
+        try:
+            return self.get_response(request)
+        finally:
+            request_cache.deactivate()
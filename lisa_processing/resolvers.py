@@ -3,23 +3,91 @@ Resolução dos algoritmos chamados nas queries.
 """
 import logging
 import itertools
-import spacy
-from difflib import get_close_matches as closest_token
 from nltk import sent_tokenize, word_tokenize
 from lisa_processing.util.nlp import (stemming, text_classifier,
-                                      get_word_offense_level, remove_stopwords,
-                                      remove_punctuations, get_offense_level,
-                                      get_tokens_pol, is_stopword,
-                                      get_word_polarity, detailed_stopword_removal)
-from lisa_processing.util.normalizer import Normalizer
+                                      get_word_offense_level, analyze_offense,
+                                      get_tokens_pol, detailed_stopword_removal)
+from lisa_processing.util.documents import (NER, PARSER, TAGGER, TOKENIZER,
+                                            get_doc, get_docs)
+from lisa_processing.util.inspection import (get_inspection_components,
+                                             inspect_doc)
+from lisa_processing.util.language_model import get_language_model
+from lisa_processing.util.normalizer import Normalizer, TokenList
+from lisa_processing.util.phrase_matcher import get_phrase_matcher
+from lisa_processing.util.preprocessing import annotate
+from lisa_processing.util.punctuation import remove_punctuation_tokens
+from lisa_processing.util.sentiment import classify_texts
+from lisa_processing.util.stopwords import get_stopwords
+from lisa_processing.util.similarity import (most_similar, similarity,
+                                             similarity_matrix)
 from lisa_processing.util.tools import (get_entity_description,
                                         get_pos_tag_description)
 
 logger = logging.getLogger('lisa')
 
-logger.info('Loading Spacy...')
-SPACY = spacy.load('pt')
-logger.info('Done!')
+
+def parse(text, components=None):
+    """
+    Processa o texto com o spaCy executando somente os componentes
+    necessários, reaproveitando o Doc já processado na requisição atual
+    (ou no cache do processo, se habilitado).
+
+    param : text : <str>
+    param : components : <tuple> : componentes do pipeline (None = todos)
+    return : <spacy.tokens.Doc>
+    """
+    return get_doc(get_language_model(), text, components)
+
+
+def parse_many(texts, components=None, batch_size=None, n_process=None):
+    """
+    Processa uma lista de textos em lote com o `nlp.pipe` do spaCy,
+    reaproveitando os Docs já processados.
+
+    param : texts : <list> de <str>
+    param : components : <tuple> : componentes do pipeline (None = todos)
+    param : batch_size : <int>
+    param : n_process : <int>
+    return : <list> de <spacy.tokens.Doc>
+    """
+    return get_docs(
+        get_language_model(), texts, components, batch_size, n_process
+    )
+
+
+def describe_entities(doc):
+    """
+    Extrai as entidades nomeadas de um Doc.
+
+    return : <list> de <dict>
+    """
+    return [{
+        'token': ent.text,
+        'entity': ent.label_,
+        'description': get_entity_description(ent.label_)
+    } for ent in doc.ents]
+
+
+def describe_part_of_speech(doc, fields=None):
+    """
+    Extrai a marcação POS de cada token de um Doc.
+
+    param : fields : <set> : campos selecionados (None = todos)
+    return : <list> de <dict>
+    """
+    if fields is None:
+        fields = {'tag', 'description'}
+
+    result = []
+    for token in doc:
+        data = {'token': token.text}
+        if 'tag' in fields:
+            data['tag'] = token.pos_
+        if 'description' in fields:
+            data['description'] = get_pos_tag_description(token.pos_)
+        result.append(data)
+
+    return result
 
 
 class Resolver:
@@ -35,10 +103,14 @@ class Resolver:
         return : <list>
         """
         normalizer = Normalizer()
-        lemma_from_list = lambda texts: SPACY(normalizer.list_to_string(texts))
+        lemma_from_str = lambda text: parse(text, TAGGER)
+        lemma_from_list = lambda texts: lemma_from_str(
+            normalizer.list_to_string(texts)
+        )
         execute = {
-            str: SPACY,
-            list: lemma_from_list
+            str: lemma_from_str,
+            list: lemma_from_list,
+            TokenList: lemma_from_list
         }
         tokens = execute.get(type(input_data))(input_data)
 
@@ -49,48 +121,47 @@ class Resolver:
         """
         Resolução do processamento de stemming
 
-        return : <list>
+        return : <TokenList>
         """
-        normalizer = Normalizer()
-        stem_from_list = lambda text_list: stemming(
-            Resolver.resolve_tokenize(normalizer.list_to_string(text_list))
-        )
-        stem_from_str = lambda text: stemming(
-            Resolver.resolve_tokenize(text)
-        )
-        execute = {
-            str: stem_from_str,
-            list: stem_from_list
-        }
-        return execute.get(type(input_data))(input_data)
+        # Listas são atomizadas item a item, sem reconstruir o texto
+        return TokenList(stemming(Resolver.resolve_tokenize(input_data)))
 
     @staticmethod
-    def resolve_dependency_parse(input_data):
+    def resolve_dependency_parse(input_data, fields=None):
         """
         Resolução do processamento de Dependency Parsing
 
         param : input_data : <str> ou <list>
+        param : fields : <set> : campos selecionados (None = todos)
         return <list> de <dict>
         """
         normalizer = Normalizer()
-        resolve_from_list = lambda text_list: SPACY(
+        if fields is None:
+            fields = {'children', 'ancestors'}
+
+        # Sem dependências selecionadas, basta a atomização
+        components = PARSER if fields & {'children', 'ancestors'} else TOKENIZER
+        resolve_from_str = lambda text: parse(text, components)
+        resolve_from_list = lambda text_list: resolve_from_str(
             normalizer.list_to_string(text_list)
         )
 
         execute = {
-            str: SPACY,
-            list: resolve_from_list
+            str: resolve_from_str,
+            list: resolve_from_list,
+            TokenList: resolve_from_list
         }
 
         tokens = execute.get(type(input_data))(input_data)
         result = []
 
         for token in tokens:
-            result.append({
-                'element': token.text,
-                'children': [str(child) for child in token.children],
-                'ancestors': [str(anc) for anc in token.ancestors]
-            })
+            data = {'element': token.text}
+            if 'children' in fields:
+                data['children'] = [str(child) for child in token.children]
+            if 'ancestors' in fields:
+                data['ancestors'] = [str(anc) for anc in token.ancestors]
+            result.append(data)
 
         return result
 
@@ -109,7 +180,8 @@ class Resolver:
         )
         execute = {
             str: text_classifier,
-            list: classify_from_list
+            list: classify_from_list,
+            TokenList: classify_from_list
         }
 
         return execute.get(type(input_data))(input_data)
@@ -128,7 +200,8 @@ class Resolver:
         )
         execute = {
             str: sent_tokenize,
-            list: list_sent_tokenize
+            list: list_sent_tokenize,
+            TokenList: list_sent_tokenize
         }
 
         return execute.get(type(input_data))(input_data)
@@ -140,18 +213,39 @@ class Resolver:
             - uma lista de sentenças <list>; ou
             - um texto puro (<str>)
 
-        return : <list> : Lista de tokens (<str>)
+        return : <TokenList> : Lista de tokens (<str>)
         """
-        list_tokenize = lambda texts: list(
-            itertools.chain(*[word_tokenize(text) for text in texts])
-        )
+        # Itens da lista que já são tokens não são reatomizados e listas de
+        # tokens de estágios anteriores são mantidas como estão
         execute = {
-            str: word_tokenize,
-            list: list_tokenize
+            str: lambda text: TokenList(word_tokenize(text)),
+            list: lambda texts: TokenList(Normalizer.list_to_tokens(texts)),
+            TokenList: lambda tokens: tokens
         }
 
         return execute.get(type(input_data))(input_data)
 
+    @staticmethod
+    def resolve_phrase_match(text, phrases):
+        """
+        Resolve a busca das expressões fornecidas no texto, sem distinção de
+        caixa. As posições são índices dos tokens do texto (fim exclusivo).
+
+        param : text : <str>
+        param : phrases : <list> de <str>
+        return : <list> de <dict>
+        """
+        tokens = word_tokenize(text)
+        matcher = get_phrase_matcher(phrases, tokenizer=word_tokenize,
+                                     lowercase=True)
+
+        return [{
+            'phrase': match.phrase,
+            'text': ' '.join(tokens[match.start:match.end]),
+            'start': match.start,
+            'end': match.end
+        } for match in matcher.iter_matches(tokens)]
+
     @staticmethod
     def resolve_remove_stopwords(input_data):
         """
@@ -159,18 +253,21 @@ class Resolver:
             - uma lista de sentenças <list>; ou
             - um texto puro (<str>)
 
-        return : <list> : Lista de tokens com significado semântico (<str>)
+        return : <TokenList> : Lista de tokens com significado semântico (<str>)
         """
-        normalizer = Normalizer()
-        remove_sw_from_str = lambda text: remove_stopwords(
-            Resolver.resolve_tokenize(text)
+        remove_sw_from_str = lambda text: TokenList(
+            token.surface for token in annotate(text) if not token.is_stop
         )
-        remove_sw_from_list = lambda text_list: remove_stopwords(
-            Resolver.resolve_tokenize(normalizer.list_to_string(text_list))
+        remove_sw_from_tokens = lambda tokens: TokenList(
+            get_stopwords().filter(tokens)
+        )
+        remove_sw_from_list = lambda text_list: remove_sw_from_tokens(
+            Resolver.resolve_tokenize(text_list)
         )
         execute = {
             str: remove_sw_from_str,
-            list: remove_sw_from_list
+            list: remove_sw_from_list,
+            TokenList: remove_sw_from_tokens
         }
 
         return execute.get(type(input_data))(input_data)
@@ -182,18 +279,21 @@ class Resolver:
             - uma lista de sentenças <list>; ou
             - um texto puro (<str>)
 
-        return : <list> : Lista de tokens (<str>)
+        return : <TokenList> : Lista de tokens (<str>)
         """
-        normalizer = Normalizer()
-        remove_puncts_from_str = lambda text: remove_punctuations(
-            Resolver.resolve_tokenize(text)
+        remove_puncts_from_str = lambda text: TokenList(
+            token.surface for token in annotate(text) if not token.is_punct
         )
-        remove_puncts_from_list = lambda text_list: remove_punctuations(
-            Resolver.resolve_tokenize(normalizer.list_to_string(text_list))
+        remove_puncts_from_tokens = lambda tokens: TokenList(
+            remove_punctuation_tokens(tokens)
+        )
+        remove_puncts_from_list = lambda text_list: remove_puncts_from_tokens(
+            Resolver.resolve_tokenize(text_list)
         )
         execute = {
             str: remove_puncts_from_str,
-            list: remove_puncts_from_list
+            list: remove_puncts_from_list,
+            TokenList: remove_puncts_from_tokens
         }
 
         return execute.get(type(input_data))(input_data)
@@ -203,35 +303,18 @@ class Resolver:
         """
         Resolve o processamento de identificação de palávras ofensivas.
 
-        param : input_data : <str> or <list>
+        param : input_data : <str>, <list> or <TokenList>
         return : <list> : Lista de <dict>
         """
-        normalizer = Normalizer()
-        resolve_from_list = lambda text_list: Resolver.resolve_tokenize(
-            normalizer.list_to_string(text_list)
-        )
-        resolve_from_str = lambda text: Resolver.resolve_tokenize(text)
-        execute = {
-            str: resolve_from_str,
-            list: resolve_from_list
-        }
-        tokens = execute.get(type(input_data))(input_data)
+        # Listas são atomizadas item a item, sem reconstruir o texto
+        tokens = Resolver.resolve_tokenize(input_data)
         pairs = get_word_offense_level(tokens)
 
-        output = []
-        for pair in pairs:
-            # o processamento retorna o radical, ams queremos ot ermo completo
-            token = closest_token(pair[0], tokens)
-
-            # se não houver use o própprio radical
-            full_token = token or pair
-            output.append({
-                'token': full_token[0],
-                'is_offensive': bool(pair[1]),
-                'value': pair[1]
-            })
-
-        return output
+        return [{
+            'token': token,
+            'is_offensive': bool(value),
+            'value': value
+        } for token, value in pairs]
 
     @staticmethod
     def resolve_text_offense(input_data):
@@ -242,18 +325,20 @@ class Resolver:
         return <dict>
         """
         normalizer = Normalizer()
-        resolve_from_list = lambda token_list: get_offense_level(
+        resolve_from_list = lambda token_list: analyze_offense(
             normalizer.list_to_string(token_list)
         )
 
         execute = {
             list: resolve_from_list,
-            str: get_offense_level
+            TokenList: resolve_from_list,
+            str: analyze_offense
         }
 
-        is_offensive, average = execute.get(type(input_data))(input_data)
+        is_offensive, average, matches = execute.get(type(input_data))(input_data)
 
-        return {'is_offensive': is_offensive, 'average': average}
+        return {'is_offensive': is_offensive, 'average': average,
+                'matches': matches}
 
     @staticmethod
     def resolve_word_polarity(input_data):
@@ -269,7 +354,8 @@ class Resolver:
 
         execute = {
             str: resolve_from_string,
-            list: get_tokens_pol
+            list: get_tokens_pol,
+            TokenList: get_tokens_pol
         }
         output = execute.get(type(input_data))(input_data)
 
@@ -285,11 +371,7 @@ class Resolver:
         """
         normalizer = Normalizer()
 
-        resolve_from_string = lambda text: [{
-            'token': ent.text,
-            'entity': ent.label_,
-            'description': get_entity_description(ent.label_)
-        } for ent in SPACY(text).ents]
+        resolve_from_string = lambda text: describe_entities(parse(text, NER))
 
         resolve_from_list = lambda text_list: resolve_from_string(
             normalizer.list_to_string(text_list)
@@ -297,26 +379,31 @@ class Resolver:
 
         execute = {
             str: resolve_from_string,
-            list: resolve_from_list
+            list: resolve_from_list,
+            TokenList: resolve_from_list
         }
 
         return execute.get(type(input_data))(input_data)
 
     @staticmethod
-    def resolve_part_of_speech(input_data):
+    def resolve_part_of_speech(input_data, fields=None):
         """
         Resolve a marcação POS na entrada fornecida.
 
         param : input_data : <list> ou <str>
+        param : fields : <set> : campos selecionados (None = todos)
         return : <list> de <dict>
         """
         normalizer = Normalizer()
 
-        resolve_from_string = lambda text: [{
-            'token': token.text,
-            'tag': token.pos_,
-            'description': get_pos_tag_description(token.pos_)
-        } for token in SPACY(text)]
+        # Sem tags selecionadas, basta a atomização
+        components = TAGGER
+        if fields is not None and not fields & {'tag', 'description'}:
+            components = TOKENIZER
+
+        resolve_from_string = lambda text: describe_part_of_speech(
+            parse(text, components), fields
+        )
 
         resolve_from_list = lambda text_list: resolve_from_string(
             normalizer.list_to_string(text_list)
@@ -324,37 +411,60 @@ class Resolver:
 
         execute = {
             str: resolve_from_string,
-            list: resolve_from_list
+            list: resolve_from_list,
+            TokenList: resolve_from_list
         }
 
         return execute.get(type(input_data))(input_data)
 
     @staticmethod
-    def resolve_token_inspection(input_data):
+    def resolve_named_entity_batch(text_list, batch_size=None, n_process=None):
+        """
+        Resolve o processamento de entidades nomeadas de cada texto de uma
+        lista, processando os textos em lote.
+
+        param : text_list : <list> de <str>
+        param : batch_size : <int>
+        param : n_process : <int>
+        return : <list> de <dict>
+        """
+        docs = parse_many(text_list, NER, batch_size, n_process)
+
+        return [{'text': text, 'output': describe_entities(doc)}
+                for text, doc in zip(text_list, docs)]
+
+    @staticmethod
+    def resolve_part_of_speech_batch(text_list, batch_size=None, n_process=None):
+        """
+        Resolve a marcação POS de cada texto de uma lista, processando os
+        textos em lote.
+
+        param : text_list : <list> de <str>
+        param : batch_size : <int>
+        param : n_process : <int>
+        return : <list> de <dict>
+        """
+        docs = parse_many(text_list, TAGGER, batch_size, n_process)
+
+        return [{'text': text, 'output': describe_part_of_speech(doc)}
+                for text, doc in zip(text_list, docs)]
+
+    @staticmethod
+    def resolve_token_inspection(input_data, fields=None, vector_format='list'):
         """
         Resolução da inspeção de tokens.
 
         param : input_data : <list> ou <str>
+        param : fields : <set> : campos selecionados (None = todos)
+        param : vector_format : <str> : formato dos vetores
         return : <list> de <dict>
         """
         normalizer = Normalizer()
+        components = get_inspection_components(fields)
 
-        resolve_from_string = lambda text: [{
-            'token': token.text,
-            'is_alpha': token.is_alpha,
-            'is_ascii': token.is_ascii,
-            'is_currency': token.is_currency,
-            'is_digit': token.is_digit,
-            'is_punct': token.is_punct,
-            'is_space': token.is_space,
-            'is_stop': is_stopword(token.text),
-            'lemma': token.lemma_,
-            'pos_tag': get_pos_tag_description(token.pos_),
-            'vector': token.vector,
-            'polarity': get_word_polarity(token.text),
-            'is_offensive': get_offense_level(token.text)[0],
-            'root': stemming([token.text])[0]
-        } for token in SPACY(text)]
+        resolve_from_string = lambda text: inspect_doc(
+            parse(text, components), fields=fields, vector_format=vector_format
+        )
 
         resolve_from_list = lambda text_list: resolve_from_string(
             normalizer.list_to_string(text_list)
@@ -362,7 +472,8 @@ class Resolver:
 
         execute = {
             str: resolve_from_string,
-            list: resolve_from_list
+            list: resolve_from_list,
+            TokenList: resolve_from_list
         }
 
         return execute.get(type(input_data))(input_data)
@@ -376,19 +487,8 @@ class Resolver:
 
         return : <dict> : Dicionário contendo detalhes da operação
         """
-        normalizer = Normalizer()
-        remove_sw_from_str = lambda text: detailed_stopword_removal(
-            Resolver.resolve_tokenize(text)
-        )
-        remove_sw_from_list = lambda text_list: detailed_stopword_removal(
-            Resolver.resolve_tokenize(normalizer.list_to_string(text_list))
-        )
-        execute = {
-            str: remove_sw_from_str,
-            list: remove_sw_from_list
-        }
-
-        return execute.get(type(input_data))(input_data)        
+        # Listas são atomizadas item a item, sem reconstruir o texto
+        return detailed_stopword_removal(Resolver.resolve_tokenize(input_data))
 
     @staticmethod
     def resolve_similarity(first, second):
@@ -396,10 +496,29 @@ class Resolver:
         Resolve a comparação de similaridade entre
         dois termos.
         """
-        first = SPACY(first)
-        second = SPACY(second)
+        return similarity(first, second)
 
-        return first.similarity(second)
+    @staticmethod
+    def resolve_similarity_matrix(texts):
+        """
+        Resolve a matriz de similaridade entre todos os pares de textos.
+
+        param : texts : <list>
+        return : <list> de <list> de <float>
+        """
+        return similarity_matrix(texts).tolist()
+
+    @staticmethod
+    def resolve_most_similar(text, k=10, source='corpus'):
+        """
+        Resolve a busca dos K termos mais similares ao texto.
+
+        param : text : <str>
+        param : k : <int>
+        param : source : <str> : 'corpus' ou 'vocabulary'
+        return : <list> de <dict>
+        """
+        return most_similar(text, k=k, source=source)
 
     @staticmethod
     def resolve_sentiment_batch_extraction(input_data):
@@ -413,8 +532,11 @@ class Resolver:
         negative_sentiments = []
         neutral_sentiments = []
 
-        for data in input_data:
-            extraction = {'text': data, 'sentiment': text_classifier(data)}
+        # Classifica todos os textos do lote de uma só vez
+        sentiments = classify_texts(input_data)
+
+        for data, sentiment in zip(input_data, sentiments):
+            extraction = {'text': data, 'sentiment': sentiment}
             if extraction['sentiment'] > 0:
                 positive_sentiments.append(extraction)
 
@@ -19,7 +19,8 @@ from lisa_processing.util.nlp import (get_word_polarity, text_classifier,
                                       get_offense_level, get_word_offense_level,
                                       is_stopword)
 from lisa_processing.util.tools import (get_pos_tag_description,
-                                       get_entity_description)
+                                       get_entity_description,
+                                       get_selected_fields)
 
 
 logger = logging.getLogger('lisa')
@@ -52,6 +53,18 @@ class WordPolarityType(graphene.ObjectType):
     polarity = graphene.Float(description='Token polarity.')
 
 
+class OffenseMatchType(graphene.ObjectType):
+    """
+    Termo ofensivo do hateset encontrado em um texto.
+    """
+    term = graphene.String(
+        description='Hateset term found (stemmed for single words).'
+    )
+    text = graphene.String(description='Matched tokens of the text.')
+    start = graphene.Int(description='Index of the first matched token.')
+    end = graphene.Int(description='Index after the last matched token.')
+
+
 class TextOffenseType(graphene.ObjectType):
     """
     Padrão de resposta para requisições de TextOffense.
@@ -63,6 +76,11 @@ class TextOffenseType(graphene.ObjectType):
     is_offensive = graphene.Boolean(
         description='True if the sentence is offensive, False if not!'
     )
+    matches = graphene.List(
+        OffenseMatchType,
+        description='Offensive words and expressions found, with positions '
+                    'over the text tokens without punctuation.'
+    )
 
 
 class WordOffenseType(graphene.ObjectType):
@@ -101,6 +119,50 @@ class PartOfSpeechType(graphene.ObjectType):
     #     self.description = get_pos_tag_description(self.tag)
 
 
+class PartOfSpeechBatchType(graphene.ObjectType):
+    """
+    Define a estrutura de resposta de cada texto da requisição de
+    partOfSpeechBatch
+    """
+    text = graphene.String(description='Analyzed text.')
+    output = graphene.List(
+        PartOfSpeechType,
+        description='Part of speech of each token of the text.'
+    )
+
+
+class NamedEntityBatchType(graphene.ObjectType):
+    """
+    Define a estrutura de resposta de cada texto da requisição de
+    namedEntityBatch
+    """
+    text = graphene.String(description='Analyzed text.')
+    output = graphene.List(
+        NamedEntityType,
+        description='Entities extracted from the text.'
+    )
+
+
+class PhraseMatchType(graphene.ObjectType):
+    """
+    Define a estrutura de resposta de cada ocorrência da requisição de
+    phraseMatch
+    """
+    phrase = graphene.String(description='Matched phrase.')
+    text = graphene.String(description='Matched tokens of the text.')
+    start = graphene.Int(description='Index of the first matched token.')
+    end = graphene.Int(description='Index after the last matched token.')
+
+
+class SimilarTermType(graphene.ObjectType):
+    """
+    Define a estrutura de resposta de cada termo da requisição de
+    mostSimilar
+    """
+    term = graphene.String(description='Indexed term.')
+    similarity = graphene.Float(description='Cosine similarity to the text.')
+
+
 class InspectTokenType(graphene.ObjectType):
     """
     Define a estrutura da resposta a inspectTokens, apresentandos
@@ -120,6 +182,10 @@ class InspectTokenType(graphene.ObjectType):
         graphene.Float,
         description='Vector data of the token'
     )
+    vector_encoded = graphene.String(
+        description='Base64 little-endian float16/float32 buffer with the '
+                    'vector data of the token (see vectorFormat).'
+    )
     polarity = graphene.Int(description='The token extracted polarity')
     is_offensive = graphene.Boolean(description='Token is a offensive term.')
     root = graphene.String(description='Stemmed root extracted from token.')
@@ -362,6 +428,31 @@ class Query(graphene.ObjectType):
             num_tokens=len(tokens)
         )
 
+    ##########################################################################
+    # PHRASE MATCH
+    ##########################################################################
+    phrase_match = graphene.List(
+        PhraseMatchType,
+        text=graphene.String(
+            required=True,
+            description='Text to be searched.'
+        ),
+        phrases=graphene.List(
+            graphene.String,
+            required=True,
+            description='Words or multi-word expressions to be found.'
+        ),
+        description='Finds every occurrence of the phrases in the text.'
+    )
+
+    def resolve_phrase_match(self, info, **kwargs):
+        logger.info(info.context._body.decode('utf-8'))
+        resolved_data = Resolver.resolve_phrase_match(
+            kwargs.get('text'),
+            kwargs.get('phrases')
+        )
+        return [PhraseMatchType(**data) for data in resolved_data]
+
     ##########################################################################
     # PART OF SPEECH
     ##########################################################################
@@ -379,9 +470,42 @@ class Query(graphene.ObjectType):
         Processa requisição de part of speech
         """
         logger.info(info.context._body.decode('utf-8'))
-        resolved_data = Resolver.resolve_part_of_speech(kwargs.get('text'))
+        resolved_data = Resolver.resolve_part_of_speech(
+            kwargs.get('text'),
+            fields=get_selected_fields(info)
+        )
         return [PartOfSpeechType(**data) for data in resolved_data]
 
+    ##########################################################################
+    # PART OF SPEECH BATCH
+    ##########################################################################
+    part_of_speech_batch = graphene.List(
+        PartOfSpeechBatchType,
+        text_list=graphene.List(
+            graphene.String,
+            required=True,
+            description='List of texts to be processed.'
+        ),
+        batch_size=graphene.Int(
+            description='Number of texts processed per batch.'
+        ),
+        description='Process part of speech for each text in the list.'
+    )
+
+    def resolve_part_of_speech_batch(self, info, **kwargs):
+        """
+        Processa requisição de part of speech em lote
+        """
+        logger.info(info.context._body.decode('utf-8'))
+        resolved_data = Resolver.resolve_part_of_speech_batch(
+            kwargs.get('text_list'),
+            batch_size=kwargs.get('batch_size')
+        )
+        return [PartOfSpeechBatchType(
+            text=data['text'],
+            output=[PartOfSpeechType(**tag) for tag in data['output']]
+        ) for data in resolved_data]
+
     ##########################################################################
     # LEMMING
     ##########################################################################
@@ -441,7 +565,10 @@ class Query(graphene.ObjectType):
         as palávras da sentença, seus dependentes e antecessores.
         """
         logger.info(info.context._body.decode('utf-8'))
-        return Resolver.resolve_dependency_parse(kwargs.get('text'))
+        return Resolver.resolve_dependency_parse(
+            kwargs.get('text'),
+            fields=get_selected_fields(info)
+        )
 
     ##########################################################################
     # NAMED ENTITY
@@ -463,6 +590,36 @@ class Query(graphene.ObjectType):
         resolved_data = Resolver.resolve_named_entity(kwargs.get('text'))
         return [NamedEntityType(**data) for data in resolved_data]
 
+    ##########################################################################
+    # NAMED ENTITY BATCH
+    ##########################################################################
+    named_entity_batch = graphene.List(
+        NamedEntityBatchType,
+        text_list=graphene.List(
+            graphene.String,
+            required=True,
+            description='List of texts for named entity processing.'
+        ),
+        batch_size=graphene.Int(
+            description='Number of texts processed per batch.'
+        ),
+        description='Extracts the entities from each text in the list.'
+    )
+
+    def resolve_named_entity_batch(self, info, **kwargs):
+        """
+        Processa a resolução de entidades nomeadas de uma lista de textos.
+        """
+        logger.info(info.context._body.decode('utf-8'))
+        resolved_data = Resolver.resolve_named_entity_batch(
+            kwargs.get('text_list'),
+            batch_size=kwargs.get('batch_size')
+        )
+        return [NamedEntityBatchType(
+            text=data['text'],
+            output=[NamedEntityType(**entity) for entity in data['output']]
+        ) for data in resolved_data]
+
     ##########################################################################
     # Word Polarity
     ##########################################################################
@@ -518,7 +675,13 @@ class Query(graphene.ObjectType):
     def resolve_text_offense_level(self, info, **kwargs):
         logger.info(info.context._body.decode('utf-8'))
         resolved_data = Resolver.resolve_text_offense(kwargs.get('text'))
-        return TextOffenseType(text=kwargs.get('text'), **resolved_data)
+        matches = [OffenseMatchType(**data)
+                   for data in resolved_data.pop('matches')]
+        return TextOffenseType(
+            text=kwargs.get('text'),
+            matches=matches,
+            **resolved_data
+        )
 
     ##########################################################################
     # Word Offense
@@ -566,12 +729,22 @@ class Query(graphene.ObjectType):
             required=True,
             description='Message to be parsed and inspected.',
         ),
+        vector_format=enums.VectorFormat(
+            default_value='list',
+            description='Serialization of token vectors: a list of floats '
+                        '(vector) or a base64 buffer (vectorEncoded).'
+        ),
         description='Returns full data of each token on the sentence.'
     )
 
     def resolve_inspect_tokens(self, info, **kwargs):
         logger.info(info.context._body.decode('utf-8'))
-        resolved_data = Resolver.resolve_token_inspection(kwargs.get('text'))
+        # Somente os campos selecionados na query são computados
+        resolved_data = Resolver.resolve_token_inspection(
+            kwargs.get('text'),
+            fields=get_selected_fields(info),
+            vector_format=kwargs.get('vector_format')
+        )
         return [InspectTokenType(**data) for data in resolved_data]
 
     ##########################################################################
@@ -596,6 +769,46 @@ class Query(graphene.ObjectType):
             kwargs.get('second_token')
         )
 
+    similarity_matrix = graphene.List(
+        graphene.List(graphene.Float),
+        texts=graphene.List(
+            graphene.String,
+            required=True,
+            description='Texts to be compared.'
+        ),
+        description='Returns the similarity between every pair of texts.'
+    )
+
+    def resolve_similarity_matrix(self, info, **kwargs):
+        logger.info(info.context._body.decode('utf-8'))
+        return Resolver.resolve_similarity_matrix(kwargs.get('texts'))
+
+    most_similar = graphene.List(
+        SimilarTermType,
+        text=graphene.String(
+            required=True,
+            description='Text to be searched.'
+        ),
+        k=graphene.Int(
+            default_value=10,
+            description='Number of terms returned.'
+        ),
+        source=enums.SimilaritySource(
+            default_value='corpus',
+            description='Index to be searched.'
+        ),
+        description='Returns the k most similar terms to the text.'
+    )
+
+    def resolve_most_similar(self, info, **kwargs):
+        logger.info(info.context._body.decode('utf-8'))
+        resolved_data = Resolver.resolve_most_similar(
+            kwargs.get('text'),
+            k=kwargs.get('k'),
+            source=kwargs.get('source')
+        )
+        return [SimilarTermType(**data) for data in resolved_data]
+
     ##########################################################################
     # Punct removal
     ##########################################################################
@@ -655,10 +868,14 @@ class Query(graphene.ObjectType):
         if reducer:
             output = CustomPipeline.execute_reducer(output, reducer)
 
-        # Inspeciona os tokens antes do processamento final
-        if kwargs.get('enable_token_inspection', False):
+        # Inspeciona os tokens antes do processamento final, computando
+        # somente os campos selecionados
+        inspection_fields = get_selected_fields(info, ('token_inspection',))
+        if kwargs.get('enable_token_inspection', False) and inspection_fields:
             token_inspection = [InspectTokenType(**data) for data
-                                in Resolver.resolve_token_inspection(output)]
+                                in Resolver.resolve_token_inspection(
+                                    output, fields=inspection_fields
+                                )]
         else:
             token_inspection = []
 
@@ -0,0 +1,114 @@
+from django.test import TestCase, override_settings
+from lisa_processing.util import request_cache
+from lisa_processing.util.documents import (NER, TAGGER, TOKENIZER, get_doc,
+                                            get_docs)
+from lisa_processing.util.lru import LRUCache
+
+
+class CountingPipeline:
+    """
+    Pipeline que registra os textos processados e os componentes
+    desabilitados em cada processamento.
+    """
+    pipe_names = ['tagger', 'parser', 'ner']
+
+    def __init__(self):
+        self.calls = []
+        self.disabled = []
+        self.batches = []
+
+    def __call__(self, text, disable=()):
+        self.calls.append(text)
+        self.disabled.append(sorted(disable))
+        return text.split()
+
+    def make_doc(self, text):
+        return self(text, disable=self.pipe_names)
+
+    def pipe(self, texts, disable=(), batch_size=None, n_process=None):
+        self.batches.append(list(texts))
+        return [text.split() for text in texts]
+
+
+class DocCacheTests(TestCase):
+    """
+    Testes de validação do cache de Docs do spaCy.
+    """
+    def setUp(self):
+        self.nlp = CountingPipeline()
+
+    def tearDown(self):
+        request_cache.deactivate()
+
+    def test_doc_is_parsed_once_per_request(self):
+        """
+        Verifica que o mesmo texto é processado uma única vez por requisição.
+        """
+        request_cache.activate()
+        first = get_doc(self.nlp, 'o rato roeu')
+        second = get_doc(self.nlp, 'o rato roeu')
+
+        self.assertIs(first, second)
+        self.assertEqual(self.nlp.calls, ['o rato roeu'])
+
+        # uma nova requisição não reaproveita os Docs da anterior
+        request_cache.activate()
+        get_doc(self.nlp, 'o rato roeu')
+        self.assertEqual(len(self.nlp.calls), 2)
+
+    def test_only_required_components_run(self):
+        """
+        Verifica que somente os componentes necessários são executados e que
+        um Doc completo é reaproveitado por tarefas que exigem menos
+        componentes.
+        """
+        request_cache.activate()
+        get_doc(self.nlp, 'o rato roeu', NER)
+        get_doc(self.nlp, 'o rato roeu', TAGGER)
+        get_doc(self.nlp, 'a roupa do rei')
+        get_doc(self.nlp, 'a roupa do rei', TAGGER)
+        get_doc(self.nlp, 'a roupa do rei', TOKENIZER)
+
+        self.assertEqual(self.nlp.disabled, [
+            ['parser', 'tagger'],
+            ['ner', 'parser'],
+            [],
+        ])
+
+    def test_batch_processes_only_missing_texts(self):
+        """
+        Verifica que o processamento em lote envia ao pipeline somente os
+        textos distintos ainda não processados, preservando a ordem.
+        """
+        request_cache.activate()
+        get_doc(self.nlp, 'o rato roeu')
+        docs = get_docs(self.nlp, ['a roupa', 'o rato roeu', 'a roupa', 'do rei'])
+
+        self.assertEqual(self.nlp.batches, [['a roupa', 'do rei']])
+        self.assertEqual(docs, [['a', 'roupa'], ['o', 'rato', 'roeu'],
+                                ['a', 'roupa'], ['do', 'rei']])
+
+    @override_settings(SPACY_DOC_CACHE_SIZE=0)
+    def test_no_cache_outside_requests(self):
+        """
+        Verifica que, sem requisição ativa e sem cache do processo, o texto é
+        sempre processado.
+        """
+        get_doc(self.nlp, 'o rato roeu')
+        get_doc(self.nlp, 'o rato roeu')
+
+        self.assertEqual(len(self.nlp.calls), 2)
+
+    def test_process_cache_is_bounded_lru(self):
+        """
+        Verifica que o cache do processo descarta o Doc menos usado.
+        """
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
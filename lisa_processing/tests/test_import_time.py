@@ -0,0 +1,38 @@
+import os
+import sys
+import subprocess
+from django.conf import settings
+from django.test import SimpleTestCase
+
+IMPORT_SCRIPT = '''
+import sys
+import django
+django.setup()
+import lisa.schema
+from lisa_processing.util.language_model import is_loaded
+print(is_loaded())
+print('spacy' in sys.modules)
+'''
+
+
+class ImportTimeTests(SimpleTestCase):
+    """
+    Testes de validação do carregamento tardio do modelo de linguagem.
+    """
+    def test_schema_import_does_not_load_model(self):
+        """
+        Verifica que importar o schema, em um processo novo, não carrega o
+        modelo de linguagem nem importa o spaCy.
+        """
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT],
+            env=env,
+            stdout=subprocess.PIPE,
+            check=True
+        ).stdout.decode('utf-8').split()
+
+        model_loaded, spacy_imported = output[-2], output[-1]
+
+        self.assertEqual(model_loaded, 'False')
+        self.assertEqual(spacy_imported, 'False')
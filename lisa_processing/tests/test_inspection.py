@@ -0,0 +1,64 @@
+import base64
+import numpy as np
+from django.test import TestCase
+from lisa_processing.util.documents import TAGGER, TOKENIZER
+from lisa_processing.util.inspection import (encode_vector,
+                                             get_inspection_components,
+                                             inspect_doc)
+
+
+class LexicalToken:
+    """
+    Token que só disponibiliza seu texto: qualquer outro atributo do spaCy
+    acessado durante a inspeção resulta em erro.
+    """
+    def __init__(self, text):
+        self.text = text
+
+
+class VectorEncodingTests(TestCase):
+    """
+    Testes de validação da serialização compacta dos vetores dos tokens.
+    """
+    def test_encoded_vector_round_trip(self):
+        """
+        Verifica que o buffer em base64 decodifica no vetor original.
+        """
+        vector = np.array([0.5, -1.25, 3.0, 0.0], dtype=np.float32)
+
+        for vector_format, dtype in (('float32', '<f4'), ('float16', '<f2')):
+            buffer = base64.b64decode(encode_vector(vector, vector_format))
+            decoded = np.frombuffer(buffer, dtype=dtype)
+            self.assertEqual(decoded.tolist(), vector.tolist())
+
+        self.assertEqual(
+            len(base64.b64decode(encode_vector(vector, 'float16'))),
+            2 * len(vector)
+        )
+
+
+class SelectiveInspectionTests(TestCase):
+    """
+    Testes de validação da inspeção restrita aos campos selecionados.
+    """
+    def test_only_selected_fields_are_computed(self):
+        """
+        Verifica que somente os campos selecionados são computados, sem
+        acessar os demais atributos dos tokens.
+        """
+        doc = [LexicalToken('Que'), LexicalToken('maravilhoso')]
+        output = inspect_doc(doc, fields={'token', 'root', 'polarity'})
+
+        self.assertEqual(output, [
+            {'token': 'Que', 'root': 'que', 'polarity': 0},
+            {'token': 'maravilhoso', 'root': 'maravilh', 'polarity': 1},
+        ])
+
+    def test_tagger_only_runs_when_needed(self):
+        """
+        Verifica que o tagger só é exigido por campos que dependem dele.
+        """
+        self.assertEqual(get_inspection_components({'token', 'is_stop'}),
+                         TOKENIZER)
+        self.assertEqual(get_inspection_components({'token', 'lemma'}), TAGGER)
+        self.assertEqual(get_inspection_components(None), TAGGER)
@@ -0,0 +1,223 @@
+import os
+import tempfile
+from stat import S_IMODE
+from unittest.mock import patch
+from django.conf import settings
+from django.test import TestCase, override_settings
+from lisa_processing.util.compiled_lexicon import (CompiledLexicon, load_table,
+                                                   write_artifact)
+from lisa_processing.util.lexicon import (CorpusIndex, build_polarity_index,
+                                          get_polarity_index)
+from lisa_processing.util.modifiers import (build_modifier_index, get_modifiers,
+                                            scan_modifiers)
+from lisa_processing.util.nlp import (get_tokens_pol, get_word_polarity,
+                                      iter_tokens_pol)
+
+
+class PolarityIndexTests(TestCase):
+    """
+    Testes de validação do índice de polaridades compartilhado construído a
+    partir do corpus SentiLex.
+    """
+    def setUp(self):
+        handler, self.path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handler, 'w') as f:
+            f.write('amor.PoS=N;TG=HUM:N0;POL:N0=1;ANOT=MAN\n')
+            f.write('morte.PoS=N;TG=HUM:N0;POL:N0=-1;ANOT=MAN\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_index_is_built_once_and_shared(self):
+        """
+        Verifica que acessos consecutivos retornam o mesmo índice imutável.
+        """
+        first = get_polarity_index()
+        second = get_polarity_index()
+
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first['amor'] = 0
+
+    def test_index_maps_stems_to_int_polarities(self):
+        """
+        Verifica que o índice contém radicais e polaridades inteiras.
+        """
+        index = build_polarity_index(self.path)
+
+        self.assertEqual(index['amor'], 1)
+        self.assertEqual(index['mort'], -1)
+
+    def test_index_reloads_when_corpus_changes(self):
+        """
+        Verifica que o índice é reconstruído quando o mtime do corpus muda.
+        """
+        corpora = dict(settings.CORPORA_PATH, sentilex_lem=self.path)
+        with override_settings(CORPORA_PATH=corpora):
+            index = CorpusIndex('sentilex_lem', build_polarity_index)
+            first = index.get()
+
+            with open(self.path, 'a') as f:
+                f.write('belo.PoS=Adj;TG=HUM:N0;POL:N0=1;ANOT=MAN\n')
+            stat = os.stat(self.path)
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            second = index.get()
+
+        self.assertIsNot(first, second)
+        self.assertNotIn('bel', first)
+        self.assertEqual(second['bel'], 1)
+
+
+class TokensPolarityTests(TestCase):
+    """
+    Testes de validação da identificação de polaridades de listas de tokens.
+    """
+    def test_duplicated_stems_keep_original_tokens(self):
+        """
+        Verifica que tokens de mesmo radical mantêm sua forma original e
+        posição na saída.
+        """
+        tokens = ['Amor', 'amores', 'morte', 'Amor', 'casa']
+        output = get_tokens_pol(tokens)
+
+        self.assertEqual([data['token'] for data in output], tokens)
+        self.assertEqual([data['polarity'] for data in output],
+                         [get_word_polarity(token) for token in tokens])
+
+    def test_large_inputs_are_processed_in_chunks(self):
+        """
+        Verifica que entradas maiores que um bloco preservam a ordem.
+        """
+        tokens = ['amor', 'morte', 'casa'] * 1000
+        output = list(iter_tokens_pol(iter(tokens), chunk_size=128))
+
+        self.assertEqual([data['token'] for data in output], tokens)
+        self.assertEqual([data['polarity'] for data in output[:3]],
+                         [get_word_polarity(token) for token in tokens[:3]])
+        self.assertEqual(output[:3] * 1000, output)
+
+
+class CompiledLexiconTests(TestCase):
+    """
+    Testes de validação do artefato binário dos corpora léxicos.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, 'sentilex.txt')
+        self.artifact = os.path.join(self.directory.name, 'lexicon.bin')
+        with open(self.source, 'w') as f:
+            f.write('à-vontade.PoS=N;TG=HUM:N0;POL:N0=1;ANOT=MAN\n')
+            f.write('abafado.PoS=Adj;TG=HUM:N0;POL:N0=-1;ANOT=JALC\n')
+            f.write('amor.PoS=N;TG=HUM:N0;POL:N0=1;ANOT=MAN\n')
+        self.data = build_polarity_index(self.source)
+        write_artifact(self.artifact, {'polarity': (self.source, self.data)})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_compiled_table_matches_corpus_index(self):
+        """
+        Verifica que a tabela carregada via mmap equivale ao índice em memória.
+        """
+        table = CompiledLexicon(self.artifact).table('polarity', self.source)
+
+        self.assertEqual(dict(table), dict(self.data))
+        self.assertEqual(len(table), len(self.data))
+        self.assertNotIn('inexistente', table)
+        self.assertEqual(table.get('inexistente', 0), 0)
+
+    def test_stale_table_is_ignored(self):
+        """
+        Verifica que a tabela não é utilizada quando o corpus foi alterado
+        após a compilação do artefato.
+        """
+        with open(self.source, 'a') as f:
+            f.write('belo.PoS=Adj;TG=HUM:N0;POL:N0=1;ANOT=MAN\n')
+
+        artifact = CompiledLexicon(self.artifact)
+
+        self.assertIsNone(artifact.table('polarity', self.source))
+        self.assertIsNone(artifact.table('hateset', self.source))
+
+    def test_artifact_is_readable_by_other_users(self):
+        """
+        Verifica que o artefato é gravado com permissão de leitura para os
+        workers de outros usuários.
+        """
+        mode = S_IMODE(os.stat(self.artifact).st_mode)
+
+        self.assertEqual(mode, 0o644)
+
+    def test_unreadable_artifact_is_ignored(self):
+        """
+        Verifica que um artefato sem permissão de leitura é ignorado.
+        """
+        stat_result = os.stat(self.artifact)
+        os.utime(self.artifact,
+                 ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+
+        with override_settings(LEXICON_ARTIFACT_PATH=self.artifact), \
+                patch('lisa_processing.util.compiled_lexicon.open', create=True,
+                      side_effect=PermissionError(13, 'Permission denied')):
+            self.assertIsNone(load_table('polarity', self.source))
+
+    def test_corrupted_artifact_is_ignored(self):
+        """
+        Verifica que um artefato truncado é ignorado, sem interromper a
+        requisição, para que o índice seja construído a partir do corpus.
+        """
+        for size in [4, 40, os.path.getsize(self.artifact) - 2]:
+            with open(self.artifact, 'r+b') as f:
+                f.truncate(size)
+            stat = os.stat(self.artifact)
+            os.utime(self.artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            with override_settings(LEXICON_ARTIFACT_PATH=self.artifact):
+                self.assertIsNone(load_table('polarity', self.source))
+
+
+class ModifierLexiconTests(TestCase):
+    """
+    Testes de validação do léxico de modificadores do classificador léxico.
+    """
+    def test_modifiers_are_stemmed_frozensets(self):
+        """
+        Verifica que os modificadores são carregados como conjuntos imutáveis
+        de radicais.
+        """
+        modifiers = get_modifiers()
+
+        self.assertIsInstance(modifiers.negation_words, frozenset)
+        self.assertIn('nunc', modifiers.negation_words)
+        self.assertIn('muit', modifiers.intensifiers)
+        self.assertIn('pouc', modifiers.reduction_words)
+
+    def test_scan_finds_all_flags_in_one_pass(self):
+        """
+        Verifica que a varredura identifica intensificação, negação e redução
+        de uma sentença.
+        """
+        flags = scan_modifiers(['nã', 'muit', 'bom'])
+        self.assertEqual(tuple(flags), (True, True, False))
+
+        flags = scan_modifiers(['pouc', 'bom'])
+        self.assertEqual(tuple(flags), (False, False, True))
+
+    def test_malformed_corpus_raises_clear_error(self):
+        """
+        Verifica que termos fora de uma seção e seções desconhecidas são
+        reportados com a linha do corpus.
+        """
+        malformed = {
+            'muito\n[intensifier]\nbastante\n': 'outside a section',
+            '[negation]\nnão\n[amplifier]\nmuito\n': 'unknown modifier section',
+        }
+        for content, message in malformed.items():
+            handler, path = tempfile.mkstemp(suffix='.txt')
+            self.addCleanup(os.remove, path)
+            with os.fdopen(handler, 'w') as f:
+                f.write(content)
+
+            with self.assertRaisesRegex(ValueError, message):
+                build_modifier_index(path)
@@ -36,3 +36,38 @@ class TextNormalizerTests(TestCase):
         self.assertTrue(isinstance(text, str))
         # como a saída deve se parecer
         self.assertEqual(text, 'o rato roeu a roupa do rei de Roma.')
+
+    def test_list_to_string_attaches_opening_and_closing_punctuation(self):
+        """
+        Verifica que pontuações de abertura se juntam ao token seguinte, as de
+        fechamento ao anterior, que aspas alternam entre abrir e fechar e que
+        travessões e hífens isolados são separados por espaços.
+        """
+        tokens = ['Ele', 'disse', ':', '"', 'Olá', '(', 'mundo', ')', '!', '"',
+                  'e', 'saiu', '...', '«', 'ok', '»']
+        text = self.refresh.list_to_string(tokens)
+
+        self.assertEqual(text, 'Ele disse: "Olá (mundo)!" e saiu... «ok»')
+
+        tokens = ['Ele', 'disse', '—', 'e', 'saiu', '–', 'rápido', '-', 'já',
+                  '.']
+        text = self.refresh.list_to_string(tokens)
+
+        self.assertEqual(text, 'Ele disse — e saiu – rápido - já.')
+
+    def test_list_to_string_long_input(self):
+        """
+        Verifica a conversão de listas muito longas de tokens.
+        """
+        tokens = ['palavra', ',', 'outra', '.'] * 25000
+        text = self.refresh.list_to_string(tokens)
+
+        self.assertEqual(text, ' '.join(['palavra, outra.'] * 25000))
+
+    def test_list_to_tokens_keeps_tokens(self):
+        """
+        Verifica que itens que já são tokens não são reatomizados.
+        """
+        tokens = self.refresh.list_to_tokens(['Olá', '!', 'bom dia', '...'])
+
+        self.assertEqual(tokens, ['Olá', '!', 'bom', 'dia', '...'])
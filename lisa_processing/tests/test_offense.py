@@ -0,0 +1,88 @@
+import os
+import tempfile
+from django.conf import settings
+from django.test import TestCase
+from lisa_processing.util.compiled_lexicon import CompiledLexicon, write_artifact
+from lisa_processing.util.nlp import get_word_offense_level, stemming
+from lisa_processing.util.offense import (build_expression_index,
+                                          build_expression_table,
+                                          get_offense_index,
+                                          load_expression_index, scan_offenses)
+
+
+class OffenseIndexTests(TestCase):
+    """
+    Testes de validação do índice de termos ofensivos do hateset.
+    """
+    def test_expressions_are_indexed(self):
+        """
+        Verifica que as expressões de mais de uma palavra do hateset são
+        encontradas com suas posições.
+        """
+        tokens = 'ele é um filho da puta , sério'.split()
+        flags, matches = scan_offenses(stemming(tokens))
+
+        self.assertIn(('filho da puta', 3, 6), matches)
+        self.assertEqual(flags[3:6], [True, True, True])
+        self.assertFalse(any(flags[:3] + flags[6:]))
+
+    def test_skipped_tokens_compose_expressions(self):
+        """
+        Verifica que stop words compõem expressões, mas não são ofensivas por
+        si só nem marcadas como ofensivas.
+        """
+        tokens = ['arma', 'de', 'fogo']
+        flags, matches = scan_offenses(stemming(tokens), [False, True, False])
+
+        self.assertEqual(flags, [True, False, True])
+        self.assertEqual(matches[0].phrase, 'arma de fogo')
+
+    def test_compiled_expressions_match_corpus(self):
+        """
+        Verifica que o autômato carregado do artefato compilado encontra as
+        mesmas expressões que o construído a partir do corpus.
+        """
+        source = settings.CORPORA_PATH['hateset']
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'lexicon.bin')
+            write_artifact(path, {
+                'expressions': (source, build_expression_table(source))
+            })
+            table = CompiledLexicon(path).table('expressions', source)
+            compiled = load_expression_index(table)
+
+        stems = stemming('ele é um filho da puta com arma de fogo'.split())
+        expected = build_expression_index(source).find(stems)
+
+        self.assertTrue(expected)
+        self.assertEqual(compiled.find(stems), expected)
+
+    def test_single_stems_match(self):
+        """
+        Verifica que termos de uma palavra são identificados pelo radical.
+        """
+        index = get_offense_index()
+        stems = stemming(['idiota', 'formosa'])
+        flags, _ = scan_offenses(stems, index=index)
+
+        self.assertEqual(flags, [True, False])
+
+    def test_word_offense_level_with_expressions(self):
+        """
+        Verifica que as palavras de uma expressão ofensiva são classificadas
+        como ofensivas, desconsiderando stop words e pontuações.
+        """
+        output = get_word_offense_level(['cabeça', 'de', 'galo', '!', 'sol'])
+
+        self.assertEqual(output, [('cabeça', 1), ('galo', 1), ('sol', 0)])
+
+    def test_word_offense_level_keeps_original_tokens(self):
+        """
+        Verifica que as palavras são retornadas na forma original, inclusive
+        palavras repetidas e de mesmo radical.
+        """
+        output = get_word_offense_level(['Idiota', 'idiotas', 'lindo', 'Idiota'])
+
+        self.assertEqual(output, [
+            ('Idiota', 1), ('idiotas', 1), ('lindo', 0), ('Idiota', 1)
+        ])
@@ -0,0 +1,83 @@
+from django.test import TestCase
+from lisa_processing.util.nlp import binary_wordmatch
+from lisa_processing.util.phrase_matcher import (Match, PhraseMatcher,
+                                                 get_phrase_matcher)
+
+
+class PhraseMatcherTests(TestCase):
+    """
+    Testes de validação do autômato de busca de expressões.
+    """
+    def test_find_overlapping_ngrams(self):
+        """
+        Verifica que expressões de tamanhos diversos, inclusive sobrepostas,
+        são encontradas com as posições corretas dos tokens.
+        """
+        matcher = PhraseMatcher(['bom dia', 'dia', 'um bom dia de sol', 'sol'])
+        tokens = 'tenha um bom dia de sol'.split()
+
+        self.assertEqual(sorted(matcher.find(tokens), key=lambda m: m[1:]), [
+            Match('um bom dia de sol', 1, 6),
+            Match('bom dia', 2, 4),
+            Match('dia', 3, 4),
+            Match('sol', 5, 6),
+        ])
+
+    def test_failure_links(self):
+        """
+        Verifica que uma expressão iniciada dentro de uma tentativa de
+        ocorrência mais longa é encontrada.
+        """
+        matcher = PhraseMatcher(['a b c d', 'b c e'])
+
+        self.assertEqual(matcher.find('a b c e'.split()),
+                         [Match('b c e', 1, 4)])
+        self.assertFalse(matcher.contains('a b c'.split()))
+
+    def test_add_after_compile(self):
+        """
+        Verifica que expressões adicionadas após uma busca são encontradas
+        sem duplicar as ocorrências das expressões anteriores.
+        """
+        matcher = PhraseMatcher(['a b', 'b'])
+        tokens = 'a b c'.split()
+        self.assertEqual(matcher.find(tokens), [Match('a b', 0, 2),
+                                                Match('b', 1, 2)])
+
+        matcher.add('c')
+        matcher.add('b c')
+        self.assertEqual(matcher.find(tokens), [
+            Match('a b', 0, 2),
+            Match('b', 1, 2),
+            Match('b c', 1, 3),
+            Match('c', 2, 3),
+        ])
+
+    def test_lowercase_and_token_phrases(self):
+        """
+        Verifica a busca sem distinção de caixa e com expressões fornecidas
+        como sequências de tokens e chaves próprias.
+        """
+        matcher = PhraseMatcher(lowercase=True)
+        matcher.add(('Volte', 'Cedo'), key='despedida')
+
+        self.assertEqual(matcher.find(['volte', 'CEDO']),
+                         [Match('despedida', 0, 2)])
+
+    def test_matcher_is_cached(self):
+        """
+        Verifica que o autômato é reaproveitado para as mesmas expressões.
+        """
+        self.assertIs(get_phrase_matcher(['bom dia', 'oi']),
+                      get_phrase_matcher({'oi', 'bom dia'}))
+
+    def test_binary_wordmatch(self):
+        """
+        Verifica a busca de palavras e expressões em um texto.
+        """
+        word_list = ['bom dia', 'até breve', 'oi']
+
+        self.assertTrue(binary_wordmatch('Olá, bom dia pessoal', word_list))
+        self.assertTrue(binary_wordmatch('oi', word_list))
+        self.assertFalse(binary_wordmatch('bom demais, até mais', word_list))
+        self.assertFalse(binary_wordmatch('(oi', ['(oi)']))
@@ -0,0 +1,37 @@
+from django.test import TestCase
+from lisa_processing.util import request_cache
+from lisa_processing.util.preprocessing import AnnotatedToken, annotate
+
+
+class PreprocessingTests(TestCase):
+    """
+    Testes de validação do fluxo de tokens anotados compartilhado pelas
+    funcionalidades léxicas.
+    """
+    def tearDown(self):
+        request_cache.deactivate()
+
+    def test_tokens_are_annotated(self):
+        """
+        Verifica as anotações de cada token do texto.
+        """
+        tokens = annotate('Que dia Lindo! Adorei.')
+
+        self.assertEqual(tokens[2], AnnotatedToken(
+            surface='Lindo', lower='lindo', stem='lind', is_punct=False,
+            is_stop=False, sentence=0
+        ))
+        self.assertTrue(tokens[0].is_stop is False and tokens[3].is_punct)
+        self.assertEqual([token.sentence for token in tokens], [0] * 4 + [1] * 2)
+
+    def test_annotations_are_cached_per_request(self):
+        """
+        Verifica que o texto é processado uma única vez por requisição.
+        """
+        request_cache.activate()
+        first = annotate('O rato roeu a roupa.')
+
+        self.assertIs(annotate('O rato roeu a roupa.'), first)
+
+        request_cache.activate()
+        self.assertIsNot(annotate('O rato roeu a roupa.'), first)
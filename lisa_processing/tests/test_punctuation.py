@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.test import SimpleTestCase
+from lisa_processing.util.nlp import remove_punctuations
+from lisa_processing.util.punctuation import (PUNCTUATION, is_punctuation,
+                                              remove_punctuation_tokens,
+                                              strip_punctuation)
+
+# Tamanho, em bytes, da entrada longa
+LARGE_INPUT_SIZE = 2**20
+
+
+class PunctuationTests(SimpleTestCase):
+    """
+    Testes de validação da identificação e remoção de pontuações.
+    """
+    def test_unicode_punctuation(self):
+        """
+        Verifica que pontuações Unicode frequentes em português são
+        identificadas e removidas.
+        """
+        for token in ['“', '”', '«', '»', '–', '—', '…', '...', '?!', "''"]:
+            self.assertTrue(is_punctuation(token), token)
+
+        for token in ['', 'a', 'Olá!', '10%', 'ex-aluno']:
+            self.assertFalse(is_punctuation(token), token)
+
+        self.assertEqual(strip_punctuation('“Olá”, mundo… – ok!'),
+                         'Olá mundo  ok')
+        self.assertEqual(remove_punctuation_tokens(['«', 'sim', '»', '', '.']),
+                         ['sim'])
+
+    def test_multi_character_punctuation_tokens_are_removed(self):
+        """
+        Verifica que tokens compostos somente de pontuações, como as
+        reticências e as aspas do NLTK ('``' e "''"), são removidos.
+        Antes, só eram removidos os tokens contidos em string.punctuation.
+        """
+        tokens = ['``', 'Bom', "''", 'dia', '...', '?!', '--', '.']
+
+        self.assertEqual(remove_punctuation_tokens(tokens), ['Bom', 'dia'])
+        self.assertEqual(remove_punctuations(tokens), ['Bom', 'dia'])
+        for token in ['``', "''", '...']:
+            self.assertTrue(is_punctuation(token), token)
+
+    def test_large_input(self):
+        """
+        Verifica a remoção de pontuações de 1 MB de texto.
+        """
+        with open(settings.CORPORA_PATH['motivational']) as f:
+            text = f.read()
+        text = (text * (LARGE_INPUT_SIZE // len(text) + 1))[:LARGE_INPUT_SIZE]
+        tokens = text.split()
+
+        stripped = strip_punctuation(text)
+        kept = remove_punctuation_tokens(tokens)
+
+        self.assertFalse(PUNCTUATION.intersection(stripped))
+        self.assertEqual(kept, [t for t in tokens if not is_punctuation(t)])
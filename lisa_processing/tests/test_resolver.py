@@ -1,5 +1,8 @@
+from unittest.mock import patch
 from django.test import TestCase
 from lisa_processing.resolvers import Resolver
+from lisa_processing.util.normalizer import Normalizer, TokenList
+from lisa_processing.util.pipelines import CustomPipeline
 
 
 class ResolverTests(TestCase):
@@ -553,3 +556,92 @@ class ResolverTests(TestCase):
         self.assertEqual(output[0].get('token'), 'Errado')
         self.assertEqual(output[1].get('token'), 'Burro')
         self.assertEqual(output[2].get('token'), 'Incorreto')
+
+    def test_resolve_token_inspection_from_string(self):
+        """
+        Verifica que a inspeção de tokens resolve corretamente os atributos
+        léxicos de cada token de uma entrada de texto.
+        """
+        text = 'Que idiota maravilhoso!'
+        output = self.resolver.resolve_token_inspection(text)
+
+        self.assertEqual([data['token'] for data in output],
+                         ['Que', 'idiota', 'maravilhoso', '!'])
+        self.assertEqual([data['polarity'] for data in output], [0, -1, 1, 0])
+        self.assertEqual([data['is_offensive'] for data in output],
+                         [False, True, False, False])
+        self.assertEqual(output[1]['root'], 'idiot')
+        self.assertFalse(output[0]['is_stop'])
+
+    def test_resolve_part_of_speech_batch(self):
+        """
+        Verifica que a marcação POS em lote retorna o resultado de cada texto,
+        na ordem de entrada, igual ao processamento individual.
+        """
+        text_list = ['O rato roeu a roupa.', 'Fui a feira da fruta.']
+        output = self.resolver.resolve_part_of_speech_batch(text_list)
+
+        self.assertEqual(len(output), 2)
+        for text, data in zip(text_list, output):
+            self.assertEqual(data['text'], text)
+            self.assertEqual(
+                data['output'], self.resolver.resolve_part_of_speech(text)
+            )
+
+    def test_resolve_token_list_is_not_retokenized(self):
+        """
+        Verifica que listas de tokens (<TokenList>) são processadas
+        diretamente, sem serem convertidas em texto e atomizadas novamente.
+        """
+        tokens = TokenList(['o', 'bom dia', 'Sr.', ',', 'rato'])
+
+        output = self.resolver.resolve_remove_stopwords(tokens)
+        self.assertTrue(isinstance(output, TokenList))
+        self.assertEqual(output, ['bom dia', 'Sr.', ',', 'rato'])
+
+        output = self.resolver.resolve_remove_puncts(output)
+        self.assertTrue(isinstance(output, TokenList))
+        self.assertEqual(output, ['bom dia', 'Sr.', 'rato'])
+
+        output = self.resolver.resolve_stemming(output)
+        self.assertTrue(isinstance(output, TokenList))
+        self.assertEqual(len(output), 3)
+        self.assertEqual(self.resolver.resolve_tokenize(output), output)
+
+    def test_resolve_plain_list_is_not_joined(self):
+        """
+        Verifica que listas comuns (Ex: wordList) são atomizadas item a item,
+        sem serem convertidas em texto e atomizadas novamente.
+        """
+        tokens = ['Fui', 'a', 'feira', 'da', 'fruta', '.']
+        with patch.object(Normalizer, 'list_to_string',
+                          side_effect=AssertionError('list_to_string')):
+            stopwords = self.resolver.resolve_remove_stopwords(tokens)
+            puncts = self.resolver.resolve_remove_puncts(tokens)
+            stems = self.resolver.resolve_stemming(tokens)
+            offense = self.resolver.resolve_word_offense(['idiota', 'lindo', '!'])
+
+        self.assertEqual(stopwords, ['Fui', 'feira', 'fruta', '.'])
+        self.assertEqual(puncts, ['Fui', 'a', 'feira', 'da', 'fruta'])
+        self.assertEqual(stems, ['fui', 'a', 'feir', 'da', 'frut', '.'])
+        for output in [stopwords, puncts, stems]:
+            self.assertTrue(isinstance(output, TokenList))
+        self.assertEqual([(word['token'], word['is_offensive'])
+                          for word in offense],
+                         [('idiota', True), ('lindo', False)])
+
+    def test_pipeline_carries_token_list(self):
+        """
+        Verifica que a lista de tokens é mantida entre os estágios de um
+        pipeline customizado.
+        """
+        output = CustomPipeline.execute_pre_processing(
+            'Fui a feira da fruta.',
+            ['tokenize', 'stopwords', 'remove_puncts']
+        )
+        self.assertTrue(isinstance(output, TokenList))
+        self.assertEqual(output, ['Fui', 'feira', 'fruta'])
+
+        output = CustomPipeline.execute_reducer(output, 'stemmer')
+        self.assertTrue(isinstance(output, TokenList))
+        self.assertEqual(output, ['fui', 'feir', 'frut'])
@@ -0,0 +1,57 @@
+from django.test import TestCase, override_settings
+from lisa_processing.util.nlp import text_classifier
+from lisa_processing.util.sentiment import (classify_batch, classify_texts,
+                                            shutdown_executor)
+
+
+class BatchSentimentTests(TestCase):
+    """
+    Testes de validação da classificação de sentimentos em lote.
+    """
+    def setUp(self):
+        self.texts = [
+            'Adorei seu perfume, é muito cheiroso!',
+            'Não volto mais àquela loja. O atendimento é péssimo!',
+            'Ontém fui ao teatro no centro da cidade.',
+            'O filme foi pouco divertido. Não foi nada ruim.',
+        ]
+
+    def test_batch_matches_text_classifier(self):
+        """
+        Verifica que a classificação em lote retorna os mesmos valores que a
+        classificação individual de cada texto.
+        """
+        output = classify_batch(self.texts)
+        expected_output = [text_classifier(text) for text in self.texts]
+
+        self.assertEqual(len(output), len(expected_output))
+        for sentiment, expected in zip(output, expected_output):
+            self.assertAlmostEqual(sentiment, expected)
+
+    def test_empty_text_handling(self):
+        """
+        Verifica que textos sem tokens classificáveis lançam erro no modo
+        estrito e resultam em None caso contrário.
+        """
+        with self.assertRaises(ZeroDivisionError):
+            classify_batch(['!', 'Amor'])
+
+        output = classify_batch(['!', 'Amor'], strict=False)
+        self.assertIsNone(output[0])
+        self.assertTrue(output[1] > 0)
+
+    @override_settings(SENTIMENT_BATCH={
+        'PARALLEL': True, 'WORKERS': 2, 'CHUNK_SIZE': 3, 'THRESHOLD': 4
+    })
+    def test_parallel_batch_matches_inline_batch(self):
+        """
+        Verifica que a execução fragmentada entre processos retorna os mesmos
+        valores, na mesma ordem, que a execução no processo atual.
+        """
+        texts = self.texts * 3
+        try:
+            output = classify_texts(texts)
+        finally:
+            shutdown_executor()
+
+        self.assertEqual(output, classify_batch(texts))
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+import numpy as np
+from django.test import TestCase
+from lisa_processing.util import similarity
+from lisa_processing.util.lru import LRUCache
+
+
+class VectorDoc:
+    """
+    Doc cujo vetor é a contagem das vogais do texto.
+    """
+    def __init__(self, text):
+        self.vector = np.array([text.count(v) for v in 'aeiou'], dtype=float)
+
+
+class VectorPipeline:
+    """
+    Pipeline que registra os textos enviados em lote.
+    """
+    pipe_names = ['tagger', 'parser', 'ner']
+
+    def __init__(self):
+        self.batches = []
+
+    def pipe(self, texts, disable=(), batch_size=None, n_process=None):
+        self.batches.append(list(texts))
+        return [VectorDoc(text) for text in texts]
+
+
+class SimilarityTests(TestCase):
+    """
+    Testes de validação do serviço de similaridade.
+    """
+    def setUp(self):
+        self.nlp = VectorPipeline()
+        patcher = patch.object(similarity, 'get_language_model',
+                               return_value=self.nlp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(similarity, '_vector_cache', LRUCache(16))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matrix_matches_pairwise_cosine(self):
+        """
+        Verifica que a matriz de similaridade corresponde ao cosseno de cada
+        par de textos, com similaridade 0 para vetores nulos.
+        """
+        texts = ['banana', 'abacaxi', 'uva', 'xyz', 'banana']
+        matrix = similarity.similarity_matrix(texts)
+
+        for i, first in enumerate(texts):
+            for j, second in enumerate(texts):
+                u, v = VectorDoc(first).vector, VectorDoc(second).vector
+                norm = np.linalg.norm(u) * np.linalg.norm(v)
+                expected = 1 if first == second else (u @ v / norm if norm else 0)
+                self.assertAlmostEqual(matrix[i, j], expected, places=5)
+
+    def test_vectors_are_cached(self):
+        """
+        Verifica que cada texto é processado uma única vez.
+        """
+        similarity.similarity('banana', 'uva')
+        similarity.similarity_matrix(['uva', 'banana', 'abacaxi', 'abacaxi'])
+
+        self.assertEqual(self.nlp.batches, [['banana', 'uva'], ['abacaxi']])
+
+    def test_most_similar_returns_top_k_in_order(self):
+        """
+        Verifica que a busca retorna os K termos mais similares, ordenados.
+        """
+        terms = ['uva', 'banana', 'kiwi', 'abacaxi', 'melancia']
+        index = (terms, similarity.normalize(
+            [VectorDoc(term).vector for term in terms]
+        ))
+        with patch.object(similarity.CORPUS_INDEX, 'get', return_value=index):
+            result = similarity.most_similar('pera', k=3)
+            self.assertEqual(similarity.most_similar('pera', k=0), [])
+
+        scores = similarity.similarity_matrix(['pera'] + terms)[0, 1:]
+        expected = [terms[i] for i in np.argsort(-scores, kind='stable')[:3]]
+        self.assertEqual([data['term'] for data in result], expected)
@@ -0,0 +1,37 @@
+from django.test import TestCase
+from lisa_processing.util.stemmer import StemmerService
+
+
+class StemmerServiceTests(TestCase):
+    """
+    Testes de validação do serviço de stemming com cache LRU.
+    """
+    def setUp(self):
+        self.stemmer = StemmerService(maxsize=2)
+
+    def test_stem_many_preserves_order(self):
+        """
+        Verifica que o stemming em lote retorna um radical por token, na
+        ordem de entrada.
+        """
+        output = self.stemmer.stem_many(['gatos', 'correndo', 'gatos'])
+
+        self.assertEqual(output, ['gat', 'corr', 'gat'])
+
+    def test_repeated_words_hit_the_cache(self):
+        """
+        Verifica que palavras repetidas são servidas pelo cache.
+        """
+        self.stemmer.stem_many(['amor', 'amor', 'amor'])
+        info = self.stemmer.info()
+
+        self.assertEqual(info['misses'], 1)
+        self.assertEqual(info['hits'], 2)
+
+    def test_cache_is_bounded(self):
+        """
+        Verifica que o cache não cresce além do tamanho máximo.
+        """
+        self.stemmer.stem_many(['amor', 'ódio', 'paz', 'guerra'])
+
+        self.assertEqual(self.stemmer.info()['size'], 2)
@@ -0,0 +1,51 @@
+import os
+import tempfile
+from django.test import TestCase
+from nltk.corpus import stopwords
+from lisa_processing.util.stopwords import StopwordRegistry, get_stopwords
+
+
+class StopwordRegistryTests(TestCase):
+    """
+    Testes de validação do registro de stop words.
+    """
+    def setUp(self):
+        handler, self.path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handler, 'w') as f:
+            f.write('# customizações\n+vc\ntb\n-não\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_registry_is_loaded_once(self):
+        """
+        Verifica que o conjunto de stop words é carregado uma única vez e
+        corresponde ao corpus do NLTK.
+        """
+        registry = get_stopwords()
+
+        self.assertIs(registry.words, get_stopwords().words)
+        self.assertEqual(registry.words, frozenset(stopwords.words('portuguese')))
+
+    def test_custom_additions_and_removals(self):
+        """
+        Verifica que as customizações do arquivo são aplicadas.
+        """
+        registry = StopwordRegistry('portuguese', self.path)
+
+        self.assertEqual(registry.load(), registry.words)
+        self.assertIn('vc', registry)
+        self.assertIn('tb', registry)
+        self.assertNotIn('não', registry)
+        self.assertIn('de', registry)
+
+    def test_mask_and_filter(self):
+        """
+        Verifica a máscara booleana e a filtragem de stop words.
+        """
+        registry = StopwordRegistry('portuguese', self.path)
+        tokens = ['vc', 'não', 'gosta', 'de', 'mim']
+
+        self.assertEqual(registry.mask(tokens), [True, False, False, True, True])
+        self.assertEqual(registry.filter(tokens), ['não', 'gosta'])
+        self.assertEqual(registry.mask([]), [])
@@ -0,0 +1,98 @@
+import os
+import unittest
+import graphene
+from django.test import TestCase
+from lisa_processing.util.tools import get_memory_usage, get_selected_fields
+
+
+class TokenType(graphene.ObjectType):
+    token = graphene.String()
+    is_stop = graphene.Boolean()
+    vector = graphene.List(graphene.Float)
+
+
+class SentenceType(graphene.ObjectType):
+    text = graphene.String()
+    tokens = graphene.List(TokenType)
+
+
+class SelectionQuery(graphene.ObjectType):
+    tokens = graphene.List(TokenType)
+    sentence = graphene.Field(SentenceType)
+
+    def resolve_tokens(self, info, **kwargs):
+        SelectionQuery.selected = get_selected_fields(info)
+        return []
+
+    def resolve_sentence(self, info, **kwargs):
+        SelectionQuery.selected = get_selected_fields(info, ('tokens',))
+        return None
+
+
+class SelectedFieldsTests(TestCase):
+    """
+    Testes de validação da extração dos campos selecionados em uma query.
+    """
+    def setUp(self):
+        self.schema = graphene.Schema(query=SelectionQuery)
+
+    def test_selected_fields(self):
+        """
+        Verifica que os campos selecionados são retornados em snake_case.
+        """
+        result = self.schema.execute('{ tokens { token isStop } }')
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(SelectionQuery.selected, {'token', 'is_stop'})
+
+    def test_selected_fields_from_fragments(self):
+        """
+        Verifica que os campos selecionados via fragmentos são considerados.
+        """
+        result = self.schema.execute('''
+            { tokens { ...Data ... on TokenType { isStop } } }
+            fragment Data on TokenType { vector }
+        ''')
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(SelectionQuery.selected, {'vector', 'is_stop'})
+
+    def test_selected_fields_from_path(self):
+        """
+        Verifica que os campos de um subcampo são obtidos pelo caminho.
+        """
+        result = self.schema.execute(
+            '{ sentence { text tokens { token vector } } }'
+        )
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(SelectionQuery.selected, {'token', 'vector'})
+
+
+class MemoryUsageTests(TestCase):
+    """
+    Testes de validação da medição de memória dos workers.
+    """
+    @unittest.skipUnless(os.path.exists('/proc/self/smaps_rollup'),
+                         'Requer /proc/self/smaps_rollup (Linux)')
+    def test_copy_on_write_pages_are_shared(self):
+        """
+        Verifica que as páginas anônimas herdadas do processo pai são
+        contabilizadas como compartilhadas no processo filho.
+        """
+        data = bytearray(b'x' * 64 * 2**20)
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            usage = get_memory_usage()
+            os.write(write_end, str(usage['shared']).encode('utf-8'))
+            os._exit(0)
+
+        os.close(write_end)
+        with os.fdopen(read_end) as f:
+            shared = int(f.read())
+        os.waitpid(pid, 0)
+
+        self.assertGreater(shared, 60 * 2**20)
+        self.assertEqual(len(data), 64 * 2**20)
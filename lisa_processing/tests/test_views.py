@@ -0,0 +1,60 @@
+import json
+from django.test import TestCase
+from lisa_processing.views import read_texts
+
+
+class StreamScoresTests(TestCase):
+    """
+    Testes de validação do endpoint de pontuação em streaming.
+    """
+    def test_stream_scores_ndjson(self):
+        """
+        Verifica que o endpoint retorna uma linha NDJSON por texto fornecido,
+        na ordem de entrada, ignorando linhas vazias.
+        """
+        body = 'Adorei seu perfume, é muito cheiroso!\n\nSeu idiota babaca\n'
+        response = self.client.post(
+            '/stream/', data=body.encode('utf-8'), content_type='text/plain'
+        )
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        output = [json.loads(line) for line in lines]
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(len(output), 2)
+        self.assertEqual(output[0]['text'], 'Adorei seu perfume, é muito cheiroso!')
+        self.assertTrue(output[0]['sentiment'] > 0)
+        self.assertFalse(output[0]['is_offensive'])
+        self.assertTrue(output[1]['is_offensive'])
+
+    def test_read_texts_replaces_invalid_utf8(self):
+        """
+        Verifica que linhas que não estão em UTF-8 são lidas com os bytes
+        inválidos substituídos, sem interromper a leitura das demais.
+        """
+        body = [b'Ol\xe1 mundo\n', b'\n', 'Bom dia\n'.encode('utf-8')]
+
+        self.assertEqual(list(read_texts(body)), ['Ol\ufffd mundo', 'Bom dia'])
+
+    def test_stream_scores_with_non_utf8_line(self):
+        """
+        Verifica que uma linha em outra codificação (Latin-1) não interrompe
+        o streaming, retornando uma linha NDJSON por texto.
+        """
+        body = 'Você é lindo\n'.encode('latin-1') + 'Seu idiota\n'.encode('utf-8')
+        response = self.client.post(
+            '/stream/', data=body, content_type='text/plain'
+        )
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        output = [json.loads(line) for line in lines]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(output), 2)
+        self.assertEqual(output[0]['text'], 'Voc\ufffd \ufffd lindo')
+        self.assertTrue(output[1]['is_offensive'])
+
+    def test_stream_scores_requires_post(self):
+        """
+        Verifica que o endpoint aceita somente requisições POST.
+        """
+        response = self.client.get('/stream/')
+        self.assertEqual(response.status_code, 405)
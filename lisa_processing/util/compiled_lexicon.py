@@ -0,0 +1,237 @@
+"""
+Módulo dedicado ao artefato binário dos corpora léxicos.
+
+O artefato é gerado pelo comando `manage.py compile_lexicon` e contém, para
+cada corpus, uma tabela ordenada de radicais acompanhada de um vetor de
+valores (int8). O artefato é aberto via mmap e cada tabela é decodificada uma
+única vez (por versão do artefato) em um dicionário, sem que os corpora
+precisem ser lidos e stemizados novamente. Artefatos incompatíveis,
+corrompidos ou sem permissão de leitura são ignorados, recorrendo aos corpora
+em texto.
+
+Os dicionários decodificados pertencem a cada processo: as buscas do
+classificador são O(1), ao custo de não compartilhar as páginas do artefato
+entre os workers. O compartilhamento de memória fica a cargo do preload
+(`preload_app` do gunicorn), que decodifica as tabelas no processo mestre
+antes do fork, mantendo-as compartilhadas via copy-on-write enquanto não
+forem modificadas.
+
+Layout (little-endian):
+    cabeçalho : MAGIC (8s) | versão (H) | número de tabelas (H)
+    diretório : nome (16s) | tamanho do corpus (Q) | mtime do corpus (q) |
+                posição da tabela (Q)   -> uma entrada por tabela
+    tabela    : número de radicais (I) | offsets ((n + 1) x I) |
+                radicais utf-8 concatenados | valores (n x b)
+"""
+import os
+import mmap
+import struct
+import logging
+import tempfile
+import threading
+from array import array
+from collections.abc import Mapping
+from django.conf import settings
+
+logger = logging.getLogger('lisa')
+
+MAGIC = b'LISALEX\x00'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<8sHH')
+ENTRY = struct.Struct('<16sQqQ')
+COUNT = struct.Struct('<I')
+
+# Erros de leitura de um artefato truncado, corrompido ou sem permissão de
+# leitura
+ARTIFACT_ERRORS = (OSError, ValueError, IndexError, struct.error)
+
+# Permissão do artefato gravado, legível pelos workers de qualquer usuário
+ARTIFACT_MODE = 0o644
+
+
+class StemTable(Mapping):
+    """
+    Mapeamento somente leitura {radical: valor} decodificado da tabela do
+    artefato.
+
+    A tabela é decodificada uma única vez em um dicionário, de forma que as
+    buscas do classificador sejam O(1).
+
+    param : buffer : <mmap> : conteúdo do artefato
+    param : position : <int> : posição da tabela no artefato
+    """
+    def __init__(self, buffer, position):
+        count = COUNT.unpack_from(buffer, position)[0]
+        start = position + COUNT.size
+        offsets = array('I')
+        offsets.frombytes(buffer[start:start + (count + 1) * COUNT.size])
+
+        start += len(offsets) * COUNT.size
+        blob = buffer[start:start + offsets[-1]]
+        values = array('b', buffer[start + offsets[-1]:
+                                   start + offsets[-1] + count])
+        if len(offsets) != count + 1 or len(values) != count or \
+                len(blob) != offsets[-1]:
+            raise ValueError('Truncated lexicon table.')
+
+        self._data = {
+            blob[offsets[index]:offsets[index + 1]].decode('utf-8'): value
+            for index, value in enumerate(values)
+        }
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
+def write_artifact(path, tables):
+    """
+    Grava o artefato binário de forma atômica.
+
+    param : path : <str> : destino do artefato
+    param : tables : <dict> : {<str> nome: (<str> caminho do corpus, <dict>)}
+                              onde cada <dict> mapeia radical -> int8
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    sections = []
+    for name, (source, data) in tables.items():
+        stems = sorted(stem.encode('utf-8') for stem in data)
+        offsets = array('I', [0])
+        for stem in stems:
+            offsets.append(offsets[-1] + len(stem))
+        values = array('b', (data[stem.decode('utf-8')] for stem in stems))
+        section = (
+            COUNT.pack(len(stems)) + offsets.tobytes() +
+            b''.join(stems) + values.tobytes()
+        )
+        stat = os.stat(source)
+        sections.append((name, stat.st_size, stat.st_mtime_ns, section))
+
+    position = HEADER.size + ENTRY.size * len(sections)
+    directory_entries = []
+    for name, size, mtime, section in sections:
+        directory_entries.append(
+            ENTRY.pack(name.encode('utf-8'), size, mtime, position)
+        )
+        position += len(section)
+
+    handler, temp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(handler, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+        f.write(b''.join(directory_entries))
+        for *_, section in sections:
+            f.write(section)
+
+    # mkstemp cria o arquivo com permissão 0600, que seria mantida após a
+    # substituição, impedindo a leitura por workers de outro usuário
+    os.chmod(temp_path, ARTIFACT_MODE)
+
+    # A substituição atômica mantém válidos os mmaps dos workers em execução
+    os.replace(temp_path, path)
+
+
+class CompiledLexicon:
+    """
+    Artefato binário aberto via mmap.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f'Incompatible lexicon artifact: {path}')
+
+        self.entries = {}
+        for index in range(count):
+            name, size, mtime, position = ENTRY.unpack_from(
+                self._buffer, HEADER.size + index * ENTRY.size
+            )
+            name = name.rstrip(b'\x00').decode('utf-8')
+            self.entries[name] = (size, mtime, position)
+
+    def table(self, name, source):
+        """
+        Retorna a tabela compilada do corpus, ou None caso o artefato não a
+        contenha ou tenha sido gerado a partir de outra versão do corpus.
+
+        param : name : <str>
+        param : source : <str> : caminho do corpus de origem
+        return : <StemTable> ou None
+        """
+        if name not in self.entries:
+            return None
+
+        size, mtime, position = self.entries[name]
+        stat = os.stat(source)
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime):
+            return None
+
+        return StemTable(self._buffer, position)
+
+
+_lock = threading.Lock()
+_artifact = (None, None)
+
+
+def get_artifact():
+    """
+    Abre (uma vez por processo) o artefato configurado em
+    settings.LEXICON_ARTIFACT_PATH, reabrindo-o se ele for recompilado.
+
+    return : <CompiledLexicon> ou None se indisponível.
+    """
+    global _artifact
+    path = getattr(settings, 'LEXICON_ARTIFACT_PATH', None)
+    if not path:
+        return None
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    with _lock:
+        loaded_mtime, artifact = _artifact
+        if loaded_mtime != mtime:
+            try:
+                artifact = CompiledLexicon(path)
+            except ARTIFACT_ERRORS as error:
+                logger.warning(f'Ignoring lexicon artifact {path}: {error}')
+                artifact = None
+            _artifact = (mtime, artifact)
+
+    return artifact
+
+
+def load_table(name, source):
+    """
+    Recupera a tabela compilada de um corpus, se disponível e atualizada.
+
+    param : name : <str>
+    param : source : <str>
+    return : <StemTable> ou None
+    """
+    artifact = get_artifact()
+    if artifact is None:
+        return None
+
+    try:
+        return artifact.table(name, source)
+    except ARTIFACT_ERRORS as error:
+        logger.warning(f'Ignoring lexicon table {name}: {error}')
+        return None
@@ -0,0 +1,174 @@
+"""
+Módulo dedicado ao cache de Docs do spaCy.
+
+Cada texto distinto é processado pelo pipeline do spaCy uma única vez por
+requisição: o Doc é armazenado no cache da requisição e reaproveitado por
+todos os resolvers da query. Opcionalmente, um cache LRU do processo
+(settings.SPACY_DOC_CACHE_SIZE) reaproveita Docs entre requisições.
+
+Cada resolver informa os componentes do pipeline que utiliza, de forma que os
+demais sejam desabilitados no processamento. Um Doc em cache é reaproveitado
+por qualquer tarefa cujos componentes ele já tenha executado.
+"""
+import threading
+from django.conf import settings
+from lisa_processing.util.lru import LRUCache
+from lisa_processing.util.request_cache import get_request_cache
+
+# Componentes do pipeline necessários para cada tipo de tarefa
+TAGGER = ('tagger',)  # part of speech, lemas e vetores de contexto
+PARSER = ('parser',)  # dependency parsing
+NER = ('ner',)  # entidades nomeadas
+TOKENIZER = ()  # somente atomização
+
+
+_lock = threading.Lock()
+_process_cache = None
+
+
+def get_process_cache():
+    """
+    Retorna o cache LRU de Docs do processo, ou None se desabilitado.
+
+    return : <LRUCache> ou None
+    """
+    global _process_cache
+    maxsize = getattr(settings, 'SPACY_DOC_CACHE_SIZE', 0)
+    if not maxsize:
+        return None
+
+    with _lock:
+        if _process_cache is None or _process_cache.maxsize != maxsize:
+            _process_cache = LRUCache(maxsize)
+
+    return _process_cache
+
+
+def find_doc(docs, components):
+    """
+    Procura, entre os Docs já processados de um texto, um que tenha executado
+    todos os componentes necessários.
+
+    param : docs : <dict> : {<frozenset> componentes executados: <Doc>}
+    param : components : <frozenset>
+    return : <spacy.tokens.Doc> ou None
+    """
+    for executed, doc in docs.items():
+        if components <= executed:
+            return doc
+
+    return None
+
+
+def process(nlp, text, components):
+    """
+    Processa o texto executando somente os componentes fornecidos.
+
+    param : nlp : <spacy.language.Language>
+    param : text : <str>
+    param : components : <frozenset>
+    return : <spacy.tokens.Doc>
+    """
+    if not components:
+        return nlp.make_doc(text)
+
+    disable = [name for name in nlp.pipe_names if name not in components]
+    return nlp(text, disable=disable)
+
+
+def resolve_components(nlp, components):
+    """
+    Normaliza os componentes necessários, considerando somente os existentes
+    no pipeline (None = todos).
+
+    param : nlp : <spacy.language.Language>
+    param : components : <tuple> ou None
+    return : <frozenset>
+    """
+    pipe_names = frozenset(nlp.pipe_names)
+    if components is None:
+        return pipe_names
+
+    return frozenset(components) & pipe_names
+
+
+def get_doc(nlp, text, components=None):
+    """
+    Retorna o Doc do texto, processando-o somente se ainda não houver, no
+    cache da requisição ou do processo, um Doc que tenha executado os
+    componentes necessários.
+
+    param : nlp : <spacy.language.Language>
+    param : text : <str>
+    param : components : <tuple> : componentes necessários (None = todos)
+    return : <spacy.tokens.Doc>
+    """
+    components = resolve_components(nlp, components)
+
+    request_docs = get_request_cache('spacy_docs')
+    if request_docs is not None:
+        doc = find_doc(request_docs.get(text, {}), components)
+        if doc is not None:
+            return doc
+
+    process_docs = get_process_cache()
+    docs = process_docs.get(text) if process_docs is not None else None
+    doc = find_doc(docs, components) if docs is not None else None
+    if doc is None:
+        doc = process(nlp, text, components)
+        if process_docs is not None:
+            process_docs.set(text, {**(docs or {}), components: doc})
+
+    if request_docs is not None:
+        request_docs.setdefault(text, {})[components] = doc
+
+    return doc
+
+
+def get_docs(nlp, texts, components=None, batch_size=None, n_process=None):
+    """
+    Retorna os Docs de uma lista de textos, na mesma ordem. Os textos ainda
+    não processados são enviados em lote ao `nlp.pipe`.
+
+    param : nlp : <spacy.language.Language>
+    param : texts : <list> de <str>
+    param : components : <tuple> : componentes necessários (None = todos)
+    param : batch_size : <int> : padrão settings.SPACY_PIPE['BATCH_SIZE']
+    param : n_process : <int> : padrão settings.SPACY_PIPE['N_PROCESS']
+    return : <list> de <spacy.tokens.Doc>
+    """
+    components = resolve_components(nlp, components)
+    config = getattr(settings, 'SPACY_PIPE', {})
+    batch_size = batch_size or config.get('BATCH_SIZE', 64)
+    n_process = n_process or config.get('N_PROCESS', 1)
+
+    request_docs = get_request_cache('spacy_docs')
+    process_docs = get_process_cache()
+
+    docs = {}
+    for text in texts:
+        cached = request_docs.get(text, {}) if request_docs is not None else {}
+        doc = find_doc(cached, components)
+        if doc is None and process_docs is not None:
+            doc = find_doc(process_docs.get(text) or {}, components)
+        if doc is not None:
+            docs[text] = doc
+
+    # Textos repetidos são processados uma única vez
+    missing = list(dict.fromkeys(text for text in texts if text not in docs))
+    if missing:
+        disable = [name for name in nlp.pipe_names if name not in components]
+        processed = nlp.pipe(
+            missing, disable=disable, batch_size=batch_size, n_process=n_process
+        )
+        for text, doc in zip(missing, processed):
+            docs[text] = doc
+            if process_docs is not None:
+                cached = process_docs.get(text) or {}
+                process_docs.set(text, {**cached, components: doc})
+
+    if request_docs is not None:
+        for text, doc in docs.items():
+            request_docs.setdefault(text, {})[components] = doc
+
+    return [docs[text] for text in texts]
@@ -0,0 +1,126 @@
+"""
+Módulo dedicado à inspeção de tokens em lote.
+
+Resolve os atributos léxicos (polaridade, ofensa, stop word e radical) de
+todos os tokens de um Doc em uma única passada contra os índices léxicos
+pré-carregados, em vez de consultar os corpora token a token. Somente os
+campos selecionados pelo cliente são computados.
+
+Os vetores dos tokens podem ser omitidos ou serializados de forma compacta,
+como um buffer float16/float32 (little-endian) codificado em base64.
+"""
+import base64
+import numpy as np
+from lisa_processing.util.documents import TAGGER, TOKENIZER
+from lisa_processing.util.lexicon import get_polarity_index
+from lisa_processing.util.nlp import stemming
+from lisa_processing.util.offense import scan_offenses
+from lisa_processing.util.punctuation import is_punctuation
+from lisa_processing.util.stopwords import get_stopwords
+from lisa_processing.util.tools import get_pos_tag_description
+
+# Tipos dos buffers de vetores codificados
+VECTOR_DTYPES = {
+    'float16': '<f2',
+    'float32': '<f4',
+}
+
+# Atributos obtidos diretamente dos tokens do spaCy
+TOKEN_ATTRIBUTES = {
+    'is_alpha': lambda token: token.is_alpha,
+    'is_ascii': lambda token: token.is_ascii,
+    'is_currency': lambda token: token.is_currency,
+    'is_digit': lambda token: token.is_digit,
+    'is_punct': lambda token: token.is_punct,
+    'is_space': lambda token: token.is_space,
+    'lemma': lambda token: token.lemma_,
+    'pos_tag': lambda token: get_pos_tag_description(token.pos_),
+}
+
+INSPECTION_FIELDS = frozenset(TOKEN_ATTRIBUTES) | {
+    'token', 'is_stop', 'root', 'polarity', 'is_offensive', 'vector',
+    'vector_encoded'
+}
+
+# Campos que dependem do tagger do spaCy
+TAGGER_FIELDS = frozenset({'lemma', 'pos_tag', 'vector', 'vector_encoded'})
+
+
+def encode_vector(vector, vector_format):
+    """
+    Codifica o vetor como um buffer binário em base64.
+
+    param : vector : <numpy.ndarray>
+    param : vector_format : <str> : 'float16' ou 'float32'
+    return : <str>
+    """
+    buffer = np.asarray(vector, dtype=VECTOR_DTYPES[vector_format]).tobytes()
+    return base64.b64encode(buffer).decode('ascii')
+
+
+def get_inspection_components(fields=None):
+    """
+    Retorna os componentes do pipeline do spaCy necessários para inspecionar
+    os campos fornecidos: somente lemas, POS e vetores dependem do tagger.
+
+    param : fields : <set> de <str> : campos selecionados (None = todos)
+    return : <tuple>
+    """
+    if fields is None or TAGGER_FIELDS & set(fields):
+        return TAGGER
+
+    return TOKENIZER
+
+
+def inspect_doc(doc, fields=None, vector_format='list'):
+    """
+    Inspeciona os tokens de um Doc do spaCy, computando somente os campos
+    fornecidos. O campo token é sempre retornado.
+
+    param : doc : <spacy.tokens.Doc>
+    param : fields : <set> de <str> : campos selecionados (None = todos)
+    param : vector_format : <str> : 'list' (lista de floats, no campo vector)
+        ou 'float16'/'float32' (buffer em base64, no campo vector_encoded)
+    return : <list> de <dict>
+    """
+    fields = INSPECTION_FIELDS if fields is None else set(fields)
+
+    texts = [token.text for token in doc]
+    columns = {'token': texts}
+
+    for name, attribute in TOKEN_ATTRIBUTES.items():
+        if name in fields:
+            columns[name] = [attribute(token) for token in doc]
+
+    if fields & {'root', 'polarity', 'is_offensive'}:
+        roots = stemming(texts)
+
+    if fields & {'is_stop', 'is_offensive'}:
+        stop_flags = get_stopwords().mask(texts)
+
+    if 'is_stop' in fields:
+        columns['is_stop'] = stop_flags
+
+    if 'root' in fields:
+        columns['root'] = roots
+
+    if 'polarity' in fields:
+        polarities = get_polarity_index()
+        columns['polarity'] = [polarities.get(root, 0) for root in roots]
+
+    if 'is_offensive' in fields:
+        # Um token é ofensivo quando, após o pré-processamento (remoção de
+        # pontuações e stop words), seu radical consta no hateset ou o token
+        # compõe uma expressão do hateset
+        skip = [is_stop or is_punctuation(text)
+                for text, is_stop in zip(texts, stop_flags)]
+        columns['is_offensive'], _ = scan_offenses(roots, skip)
+
+    if vector_format == 'list' and 'vector' in fields:
+        columns['vector'] = [token.vector for token in doc]
+    elif vector_format in VECTOR_DTYPES and 'vector_encoded' in fields:
+        columns['vector_encoded'] = [
+            encode_vector(token.vector, vector_format) for token in doc
+        ]
+
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
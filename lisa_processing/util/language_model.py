@@ -0,0 +1,50 @@
+"""
+Módulo dedicado ao registro dos modelos de linguagem do spaCy.
+
+Os modelos são carregados somente no primeiro uso, de forma que comandos do
+manage.py, migrações, testes e consultas puramente léxicas não paguem o custo
+de carregar o spaCy. O carregamento antecipado pode ser habilitado no boot da
+aplicação WSGI com settings.SPACY_EAGER_LOAD.
+"""
+import logging
+import threading
+from django.conf import settings
+
+logger = logging.getLogger('lisa')
+
+_lock = threading.Lock()
+_models = {}
+
+
+def get_language_model(name=None):
+    """
+    Retorna o modelo de linguagem do spaCy, carregando-o no primeiro uso.
+
+    param : name : <str> : nome do modelo, padrão settings.SPACY_MODEL
+    return : <spacy.language.Language>
+    """
+    name = name or getattr(settings, 'SPACY_MODEL', 'pt')
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _lock:
+        if name not in _models:
+            # O spaCy só é importado quando um modelo é de fato necessário
+            import spacy
+
+            logger.info('Loading Spacy...')
+            _models[name] = spacy.load(name)
+            logger.info('Done!')
+
+    return _models[name]
+
+
+def is_loaded(name=None):
+    """
+    Verifica se o modelo de linguagem já foi carregado.
+
+    param : name : <str>
+    return : <bool>
+    """
+    return (name or getattr(settings, 'SPACY_MODEL', 'pt')) in _models
@@ -0,0 +1,137 @@
+"""
+Módulo dedicado aos índices léxicos compartilhados pelo processo.
+
+Os corpora léxicos são lidos e stemizados uma única vez (no primeiro uso ou
+no boot do worker) e mantidos em estruturas imutáveis, que são recarregadas
+automaticamente quando o arquivo do corpus é modificado. Quando houver um
+artefato compilado (`manage.py compile_lexicon`) atualizado, as tabelas são
+servidas diretamente do mmap do artefato.
+"""
+import os
+import threading
+from types import MappingProxyType
+from nltk.stem import SnowballStemmer
+from django.conf import settings
+from lisa_processing.util.compiled_lexicon import load_table
+
+
+class CorpusIndex:
+    """
+    Índice imutável construído a partir de um arquivo de corpus.
+
+    O índice é construído no primeiro acesso e reconstruído sempre que o
+    mtime do arquivo mudar (hot-reload), de forma segura entre threads.
+
+    param : corpus : <str> : chave do corpus em settings.CORPORA_PATH
+    param : builder : <callable> : recebe o caminho do arquivo e retorna
+                                   o índice construído.
+    param : table : <str> : nome da tabela no artefato compilado (opcional)
+    param : loader : <callable> : recebe a tabela compilada e retorna o
+                                  índice (opcional, padrão = a própria tabela)
+    """
+    def __init__(self, corpus, builder, table=None, loader=None):
+        self.corpus = corpus
+        self.builder = builder
+        self.table = table
+        self.loader = loader
+        self._lock = threading.Lock()
+        # (mtime, índice) são trocados juntos para evitar leituras parciais
+        self._state = (None, None)
+
+    @property
+    def path(self):
+        return settings.CORPORA_PATH[self.corpus]
+
+    def get(self):
+        """
+        Retorna o índice, reconstruindo-o se o corpus tiver sido alterado.
+        """
+        mtime = os.stat(self.path).st_mtime_ns
+        loaded_mtime, data = self._state
+        if data is not None and loaded_mtime == mtime:
+            return data
+
+        with self._lock:
+            loaded_mtime, data = self._state
+            if data is None or loaded_mtime != mtime:
+                data = self.build()
+                self._state = (mtime, data)
+
+        return data
+
+    def build(self):
+        """
+        Constrói o índice, preferindo a tabela do artefato compilado.
+        """
+        data = load_table(self.table, self.path) if self.table else None
+        if data is None:
+            data = self.builder(self.path)
+        elif self.loader:
+            data = self.loader(data)
+
+        return data
+
+    def clear(self):
+        """
+        Descarta o índice carregado, forçando a reconstrução no próximo uso.
+        """
+        with self._lock:
+            self._state = (None, None)
+
+
+def build_polarity_index(path):
+    """
+    Lê o corpus SentiLex, retornando um mapeamento imutável contendo o
+    termo stemmizado como chave e sua polaridade (<int>) como valor.
+
+    param : path : <str>
+    return : <mappingproxy>
+    """
+    stemmer = SnowballStemmer('portuguese')
+    data = {}
+    with open(path, 'r') as f:
+        for row in f:
+            splitter = row.find('.')
+            word = stemmer.stem(row[:splitter])
+            pol_loc = row.find('POL')
+            polarity = (row[pol_loc+7:pol_loc+9]).replace(';', '')
+            data[word] = int(polarity)
+
+    return MappingProxyType(data)
+
+
+def build_hateset_index(path):
+    """
+    Lê o corpus hateset.txt, retornando o conjunto imutável contendo a raiz
+    dos termos ofensivos do corpus.
+
+    param : path : <str>
+    return : <frozenset>
+    """
+    stemmer = SnowballStemmer('portuguese')
+    with open(path) as f:
+        data = frozenset(stemmer.stem(row.lower().rstrip('\n')) for row in f)
+
+    return data
+
+
+SENTILEX = CorpusIndex('sentilex_lem', build_polarity_index, table='polarity')
+HATESET = CorpusIndex('hateset', build_hateset_index, table='hateset')
+
+
+def get_polarity_index():
+    """
+    Retorna o índice de polaridades compartilhado pelo processo.
+
+    return : <mappingproxy> : {<str> radical: <int> polaridade}
+    """
+    return SENTILEX.get()
+
+
+def get_hateset_index():
+    """
+    Retorna o conjunto de radicais ofensivos compartilhado pelo processo.
+
+    return : <frozenset> ou <StemTable> : radicais ofensivos
+    """
+    return HATESET.get()
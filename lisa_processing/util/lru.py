@@ -0,0 +1,36 @@
+"""
+Módulo dedicado ao cache LRU limitado compartilhado entre as threads de um
+processo.
+"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Cache LRU limitado e seguro entre threads.
+
+    param : maxsize : <int>
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
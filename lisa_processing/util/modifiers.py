@@ -0,0 +1,108 @@
+"""
+Módulo dedicado ao léxico de modificadores do classificador de Taboada.
+
+Os termos de negação, intensificação e redução são lidos do corpus
+configurado em settings.CORPORA_PATH['modifiers'], stemizados uma única vez
+e mantidos em conjuntos imutáveis compartilhados pelo processo.
+"""
+from collections import namedtuple
+from types import MappingProxyType
+from lisa_processing.util.lexicon import CorpusIndex
+from lisa_processing.util.stemmer import get_stemmer
+
+NEGATION = 1
+INTENSIFIER = 2
+REDUCER = 4
+
+SECTIONS = {
+    'negation': NEGATION,
+    'intensifier': INTENSIFIER,
+    'reducer': REDUCER,
+}
+
+# Conjuntos de radicais modificadores e o mapeamento radical -> flags
+# (combinação de NEGATION, INTENSIFIER e REDUCER)
+ModifierLexicon = namedtuple(
+    'ModifierLexicon',
+    ['negation_words', 'intensifiers', 'reduction_words', 'flags']
+)
+
+SentenceModifiers = namedtuple(
+    'SentenceModifiers',
+    ['is_intensified', 'has_negation', 'is_reduced']
+)
+
+
+def build_modifier_index(path):
+    """
+    Lê o corpus de modificadores, composto de seções ([negation],
+    [intensifier] e [reducer]) contendo um termo por linha.
+
+    param : path : <str>
+    return : <ModifierLexicon>
+    raises : <ValueError> : seção desconhecida ou termo fora de uma seção
+    """
+    stemmer = get_stemmer()
+    flags = {}
+    section = None
+    with open(path) as f:
+        for line, row in enumerate(f, 1):
+            row = row.strip()
+            if not row or row.startswith('#'):
+                continue
+            if row.startswith('[') and row.endswith(']'):
+                name = row[1:-1].strip()
+                if name not in SECTIONS:
+                    raise ValueError(
+                        f'{path}:{line}: unknown modifier section [{name}]'
+                    )
+                section = SECTIONS[name]
+                continue
+            if section is None:
+                raise ValueError(
+                    f'{path}:{line}: modifier term "{row}" outside a section'
+                )
+            stem = stemmer.stem(row)
+            flags[stem] = flags.get(stem, 0) | section
+
+    return ModifierLexicon(
+        negation_words=frozenset(s for s, f in flags.items() if f & NEGATION),
+        intensifiers=frozenset(s for s, f in flags.items() if f & INTENSIFIER),
+        reduction_words=frozenset(s for s, f in flags.items() if f & REDUCER),
+        flags=MappingProxyType(flags)
+    )
+
+
+MODIFIERS = CorpusIndex('modifiers', build_modifier_index)
+
+
+def get_modifiers():
+    """
+    Retorna o léxico de modificadores compartilhado pelo processo.
+
+    return : <ModifierLexicon>
+    """
+    return MODIFIERS.get()
+
+
+def scan_modifiers(stemmed_tokens, modifiers=None):
+    """
+    Percorre os tokens stemizados de uma sentença uma única vez, identificando
+    simultaneamente intensificadores, negações e redutores.
+
+    param : stemmed_tokens : <list>
+    param : modifiers : <ModifierLexicon> : opcional, padrão compartilhado
+    return : <SentenceModifiers>
+    """
+    flags = (modifiers or get_modifiers()).flags
+    found = 0
+    for token in stemmed_tokens:
+        found |= flags.get(token, 0)
+        if found == NEGATION | INTENSIFIER | REDUCER:
+            break
+
+    return SentenceModifiers(
+        is_intensified=bool(found & INTENSIFIER),
+        has_negation=bool(found & NEGATION),
+        is_reduced=bool(found & REDUCER)
+    )
@@ -2,35 +2,36 @@
 Módulo para funcionalidades relacionadas ao Processamento de Linguagem
 Natural.
 """
-import re
+from itertools import islice
 from random import choice
-from string import punctuation
 from nltk import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import SnowballStemmer
-from django.conf import settings
+from lisa_processing.util.lexicon import get_hateset_index, get_polarity_index
+from lisa_processing.util.modifiers import get_modifiers, scan_modifiers
 from lisa_processing.util.normalizer import Normalizer
+from lisa_processing.util.offense import scan_offenses
+from lisa_processing.util.phrase_matcher import get_phrase_matcher
+from lisa_processing.util.preprocessing import annotate
+from lisa_processing.util.punctuation import (remove_punctuation_tokens,
+                                              strip_punctuation)
+from lisa_processing.util.stemmer import get_stemmer
+from lisa_processing.util.stopwords import get_stopwords
+
+# Número de tokens stemizados por vez na identificação de polaridades
+TOKENS_POL_CHUNK_SIZE = 4096
 
 
 def get_pols_from_corpus():
     """
-    Abre o corpus léxico que contém a identificação
-    da polaridade dos termos, retornando um dicionário
-    contendo o termo stemmizado como chave e sua polaridade como valor.
+    Retorna o índice léxico que contém a identificação
+    da polaridade dos termos: um mapeamento imutável contendo
+    o termo stemmizado como chave e sua polaridade como valor.
 
-    return : <dict>
-    """
-    data = {}
-    with open(settings.CORPORA_PATH['sentilex_lem'], 'r') as f:
-        for row in f.readlines():
-            splitter = row.find('.')
-            word = (row[:splitter])
-            word = stemming([word])[0]
-            pol_loc = row.find('POL')
-            polarity = (row[pol_loc+7:pol_loc+9]).replace(';','')
-            data[word] = polarity
+    O índice é construído uma única vez por processo e recarregado
+    somente quando o arquivo do corpus é modificado.
 
-    return data
+    return : <mappingproxy>
+    """
+    return get_polarity_index()
 
 
 def get_word_polarity(word_input):
@@ -44,10 +45,31 @@ def get_word_polarity(word_input):
 
     # verifica se a palavra existe no corpus lexico
     stemmed_word = stemming([word_input])[0]
-    if stemmed_word.lower() in data.keys():
-        return int(data[stemmed_word.lower()])
+    return data.get(stemmed_word.lower(), 0)
+
+
+def iter_tokens_pol(token_list, chunk_size=TOKENS_POL_CHUNK_SIZE):
+    """
+    Identifica a polaridade de cada token contido na entrada, na mesma ordem,
+    gerando um dicionário por token à medida que os blocos de tokens são
+    stemizados. Permite processar entradas muito grandes sem materializar
+    todos os resultados.
+
+    param : token_list : <iterable> : tokens (str)
+    param : chunk_size : <int> : número de tokens stemizados por bloco
+    return : <generator> de <dict>
+    """
+    data = get_pols_from_corpus()
+    tokens = iter(token_list)
+
+    chunk = list(islice(tokens, chunk_size))
+    while chunk:
+        # cada radical é pareado com o token original da mesma posição
+        for token, stem in zip(chunk, stemming(chunk)):
+            # se o token não estiver nos dados obtidos do corpus considerar neutro
+            yield {'token': token, 'polarity': data.get(stem, 0)}
 
-    return 0
+        chunk = list(islice(tokens, chunk_size))
 
 
 def get_tokens_pol(token_list):
@@ -58,19 +80,7 @@ def get_tokens_pol(token_list):
     param : token_list : <list> : lista de tokens (str)
     return : <list> : Lista de <dict>
     """
-    data = get_pols_from_corpus()
-    output = []
-
-    stemmed_tokens = stemming(token_list)
-    for token in stemmed_tokens:
-        # recupera o token original não stemizado através do indice do token
-        original_token = token_list[stemmed_tokens.index(token)]
-
-        # se o token não estiver nos dados obtidos do corpus considerar neutro
-        polarity = data.get(token, 0)
-        output.append({'token': original_token, 'polarity': int(polarity)})
-
-    return output
+    return list(iter_tokens_pol(token_list))
 
 
 def text_classifier(text):
@@ -82,54 +92,29 @@ def text_classifier(text):
     return : <float>
     """
     corpus = get_pols_from_corpus()
+    modifiers = get_modifiers()
     sentence_sentiments = []
 
-    negation_words = stemming([
-        'jamais', 'nada', 'nem', 'nenhum', 'ninguém', 'nunca', 'não',
-        'tampouco', 'insignigficância', 'insignificante', 'besteira',
-        'argueiro', 'bobagem', 'futilidade', 'fútil'
-    ])
-    intensifiers = stemming([
-        'mais', 'muito', 'demais', 'completamente', 'absolutamente',
-        'totalmente', 'definitivamente', 'extremamente',
-        'frequentemente', 'bastante', 'abundante', 'abundância',
-        'enxurrada', 'exurbitância', 'fartura'
-    ])
-    reduction_words = stemming([
-        'pouco', 'quase', 'menos', 'apenas', 'anormal', 'anômalo', 'banal',
-        'atípico', 'excepcional', 'inabitual', 'raro', 'singular',
-        'inusitado', 'unusual', 'incomum', 'insólito', 'aproximadamente',
-        'triz'
-    ])
-
-    # Sentence segmentation
-    sentences = sent_tokenize(text.lower())
-
-    for sentence in sentences:
-
-        # Pré-processa os dados de texto
-        tokens = word_tokenize(sentence)
-        tokens = remove_punctuations(tokens)
-        tokens = stemming(tokens)
-
-        # Verifica a existência de termos intensificadores
-        text_is_intensified = any(token in intensifiers for token in tokens)
-
-        # Verifica a inversão de valor por meio de termos de negação
-        text_has_negation = any(token in negation_words for token in tokens)
-
-        # Verifica a existência de termos redutores
-        text_is_reduced = any(token in reduction_words for token in tokens)
+    # Radicais de cada sentença, desconsiderando as pontuações
+    sentences = {}
+    for token in annotate(text):
+        stems = sentences.setdefault(token.sentence, [])
+        if not token.is_punct:
+            stems.append(token.stem)
+
+    for tokens in sentences.values():
+
+        # Verifica, em uma única passada, a existência de termos
+        # intensificadores, de negação (inversão de valor) e redutores
+        text_is_intensified, text_has_negation, text_is_reduced = \
+            scan_modifiers(tokens, modifiers)
 
         # Polariza o texto em análise
         for token in tokens:
             # Identifica a polaridade do token
-            if token.lower() in corpus.keys():
-                token_polarity = int(corpus[token.lower()])
-            else:
-                # TODO: talvez, através de um algoritmo de agrupamento,
-                # classificar o termo baseado em outros termos similares
-                token_polarity = 0
+            # TODO: talvez, através de um algoritmo de agrupamento,
+            # classificar o termo ausente baseado em outros termos similares
+            token_polarity = corpus.get(token.lower(), 0)
 
             if text_is_intensified:
                 if text_has_negation:
@@ -156,43 +141,20 @@ def text_classifier(text):
 
 def binary_wordmatch(input_text, word_list):
     """
-    Percorre uma entrada de texto buscand identificar se uma palavra,
-    composta de até duas palavras (Ex: Bom dia, Até breve, volte cedo)
-    existe no contexto.
+    Percorre uma entrada de texto buscando identificar se uma palavra ou
+    expressão, composta de uma ou mais palavras (Ex: Bom dia, Até breve,
+    volte cedo) existe no contexto.
 
     A função recebe dois parâmetros: A entrada de texto e uma lista ou
-    conjunto contendo as palávras que se pretende encontrar no texto.
+    conjunto contendo as palávras que se pretende encontrar no texto. As
+    expressões são compiladas (e reaproveitadas entre chamadas) em um
+    autômato de Aho-Corasick, percorrendo o texto uma única vez.
 
     param : input_text : <str>
     param : word_list : <list>
     return : <bool>
     """
-    #####################################################################
-    # TODO: o spacy implementa bigramas, trigramas e ngramas, substituir
-    # essa função por elas!
-    #####################################################################
-
-    prev_word = ''
-    match = False
-    for word in input_text.split():
-        try:
-            single_match = [re.fullmatch(word, target) for target in word_list]
-        except:
-            single_match = []
-
-        try:
-            binary_match = [re.fullmatch(f'{prev_word} {word}', target) for target in word_list]
-        except:
-            binary_match = []
-
-        if any(single_match):
-            match = True
-            break
-        elif any(binary_match):
-            match = True
-            break
-        prev_word = word
-    return match
+    return get_phrase_matcher(word_list).contains(input_text.split())
 
 
 def remove_stopwords(sentence):
@@ -202,8 +164,7 @@ def remove_stopwords(sentence):
     param : sentence : <list> : Lista de tokens
     return: <list>
     """
-    portuguese_stopwords = set(stopwords.words('portuguese'))
-    return [word for word in sentence if word not in portuguese_stopwords]
+    return get_stopwords().filter(sentence)
 
 
 def detailed_stopword_removal(input_data):
@@ -216,7 +177,7 @@ def detailed_stopword_removal(input_data):
     return <dict>
     """
     normalizer = Normalizer()
-    portuguese_stopwords = set(stopwords.words('portuguese'))
+    portuguese_stopwords = get_stopwords().words
     removed = []  # tokens que serão removidos, ou seja, os stop words;
     non_stop = []  # tokens que não são stop words;
 
@@ -242,8 +203,7 @@ def is_stopword(token):
     param : token : <str>
     return : <bool>
     """
-    portuguese_stopwords = set(stopwords.words('portuguese'))
-    return token in portuguese_stopwords
+    return token in get_stopwords()
 
 
 def remove_stopwords_from_str(text):
@@ -253,8 +213,7 @@ def remove_stopwords_from_str(text):
     param : text : <str>
     return <list>
     """
-    portuguese_stopwords = set(stopwords.words('portuguese'))
-    return [word for word in text.split() if word not in portuguese_stopwords]
+    return get_stopwords().filter(text.split())
 
 
 def remove_punctuations(sentence):
@@ -264,7 +223,7 @@ def remove_punctuations(sentence):
     param : sentence : <list> lista de tokens
     return : <list>
     """
-    return [token for token in sentence if token not in punctuation]
+    return remove_punctuation_tokens(sentence)
 
 
 def remove_puncts_from_string(text_sentence):
@@ -275,87 +234,104 @@ def remove_puncts_from_string(text_sentence):
     param : text_sentence : <str>
     return : <list>
     """
-    return ''.join(ch for ch in text_sentence if ch not in punctuation).split()
+    return strip_punctuation(text_sentence).split()
 
 
 def stemming(token_list):
     """
     Realiza o stemming nos tokens fornecidos.
 
+    Os radicais são memorizados pelo serviço de stemming compartilhado.
+
     param : token_list : <list>
     return <list>
     """
-    stemmer = SnowballStemmer('portuguese')
-    return [stemmer.stem(token) for token in token_list]
+    return get_stemmer().stem_many(token_list)
 
 
 def get_hateset():
     """
-    Abre o corpus hateset.txt cujo possui amostras de termos ofensivos,
-    realiza o slicing das linhas do arquivo retornando somente o termo principal
-    para o stemmer, filtrando as duplicatas e retornando um conjunto (set)
-    contendo a raiz dos termos do corpus.
+    Retorna o índice do corpus hateset.txt cujo possui amostras de termos
+    ofensivos: um conjunto imutável contendo a raiz dos termos do corpus,
+    construído uma única vez por processo.
 
-    return : <set> |> <str> : Conjunto de termos stemizados.
+    return : <frozenset> |> <str> : Conjunto de termos stemizados.
     """
-    with open(settings.CORPORA_PATH['hateset']) as f:
-        data = set(stemming([i.lower()[:-1] for i in f.readlines()]))
-
-    return data
+    return get_hateset_index()
 
 
-def get_offense_level(text):
+def analyze_offense(text):
     """
-    Mede o nível de baixo calão na frase dada a quantidade
-    de "palavras feias" contidas no texto.
-    """
-    count = 0
+    Identifica os termos ofensivos do texto, de uma ou mais palavras, e mede
+    o nível de baixo calão na frase dada a quantidade de "palavras feias"
+    contidas no texto.
+
+    As posições dos termos encontrados se referem aos tokens do texto sem
+    pontuações.
 
-    # pré-processa a entrada e retorna as amostras também pré-processadas
-    text = stemming(basic_preprocess(text))
-    data = get_hateset()
+    param : text : <str>
+    return : <tuple> : (<bool>, <float>, <list> de <dict>)
+    """
+    annotated = [token for token in annotate(text) if not token.is_punct]
+    tokens = [token.surface for token in annotated]
+    stop_flags = [token.is_stop for token in annotated]
+    flags, matches = scan_offenses([token.stem for token in annotated],
+                                   stop_flags)
 
-    # Contabiliza as ocorrências
-    for word in text:
-        if word in data:
-            count += 1
+    # Contabiliza as ocorrências entre os tokens pré-processados (sem stop
+    # words), assim como em basic_preprocess
+    offenses = [flag for flag, is_stop in zip(flags, stop_flags) if not is_stop]
+    count = sum(offenses)
 
     # Se a entrada conter somente stopwords, possivelmente o pre-processamento
     # irá "esvaziar" a entrada, resultando em uma possível divisão por zero
     try:
-        average = count / len(text)
+        average = count / len(offenses)
     except ZeroDivisionError:
         average = 0
 
     # Define como sugestão de ofensa se a média for maior ou igual a 25%
     response = average >= .25
 
+    return response, average, [{
+        'term': match.phrase,
+        'text': ' '.join(tokens[match.start:match.end]),
+        'start': match.start,
+        'end': match.end
+    } for match in matches]
+
+
+def get_offense_level(text):
+    """
+    Mede o nível de baixo calão na frase dada a quantidade
+    de "palavras feias" contidas no texto.
+    """
+    response, average, _ = analyze_offense(text)
+
     return (response, average)
 
 
 def get_word_offense_level(word_list):
     """
-    Verifica se as palavras fornecidas são ofensivas baseadas no hateset.
+    Verifica se as palavras fornecidas são ofensivas baseadas no hateset,
+    incluindo as que compõem expressões ofensivas. Pontuações e stop words
+    são desconsideradas.
     Retorna uma lista de tuplas contendo:
-        - Palavra analisada;
+        - Palavra analisada, na forma original;
         - Inteiro representando se ofensivo (1) ou não ofensivo (0);
         - Formato [(<str>, <int>), (<str>, <int>), ...]
     param : word_list : <list> |> <str> : Lista de palavras;
     return : <list> |> <tuple>
     """
-    result = []
+    # stemiza a entrada, mantendo as stop words para a busca de expressões
+    tokens = remove_punctuations(word_list)
+    stop_flags = get_stopwords().mask(tokens)
+    flags, _ = scan_offenses(stemming(tokens), stop_flags)
 
-    # stemiza a entrada e recupera as amostras também pré-processadas
-    tokens = stemming(remove_stopwords(remove_punctuations(word_list)))
-    data = get_hateset()
-
-    # TODO: Pensar em uma forma de retornar na tupla o termo completo e não a raiz
-    for token in tokens:
-        if token in data:
-            result.append((token, 1))
-        else:
-            result.append((token, 0))
-    return result
+    # Os tokens originais são mantidos ao lado dos radicais
+    return [(token, int(flag))
+            for token, flag, is_stop in zip(tokens, flags, stop_flags)
+            if not is_stop]
 
 
 def basic_preprocess(text):
@@ -365,14 +341,5 @@ def basic_preprocess(text):
     param : text : <str>
     return : <list>
     """
-    sentences = sent_tokenize(text)
-    pre_processed_tokens = []
-    for sentence in sentences:
-        tokens = word_tokenize(sentence)
-        tokens = remove_punctuations(tokens)
-        tokens = remove_stopwords(tokens)
-
-        for token in tokens:
-            pre_processed_tokens.append(token)
-
-    return pre_processed_tokens
+    return [token.surface for token in annotate(text)
+            if not token.is_punct and not token.is_stop]
@@ -1,5 +1,25 @@
+import unicodedata
 from nltk import word_tokenize
-from string import punctuation
+from lisa_processing.util.punctuation import PUNCTUATION, is_punctuation
+
+# Pontuações que se juntam ao token seguinte
+OPENING_PUNCTUATION = frozenset(['(', '[', '{', '«', '“', '‘', '¿', '¡', '``'])
+
+# Aspas que abrem e fecham alternadamente
+QUOTES = frozenset(['"', "'"])
+
+# Travessões e hífens isolados (Ex: diálogos e apostos), separados por espaços
+DASHES = frozenset(
+    char for char in PUNCTUATION if unicodedata.category(char) == 'Pd'
+) | frozenset(['--'])
+
+
+class TokenList(list):
+    """
+    Lista de tokens já atomizados, trafegada entre os estágios de um
+    pipeline. Os resolvers operam diretamente sobre ela, sem reconstruir o
+    texto e atomizá-lo novamente.
+    """
 
 
 class Normalizer:
@@ -13,21 +33,61 @@ class Normalizer:
         """
         Recebe uma lista de strings e devolve uma string.
 
+        Pontuações de fechamento (Ex: . , ! ) » ”) se juntam ao token
+        anterior, pontuações de abertura (Ex: ( « “) ao token seguinte, as
+        aspas retas alternam entre abertura e fechamento e travessões
+        (Ex: — –) são separados por espaços. O texto é montado
+        em uma única junção, em tempo linear.
+
         param : token_list: <list>
         return : <str>
         """
-        text = ''
+        parts = []
+        attach = True  # o próximo token se junta ao anterior
+        open_quotes = set()
+
         for token in token_list:
-            if token not in punctuation:
-                text += f'{token} '
+            if not token:
+                continue
+
+            if token in QUOTES:
+                closing = token in open_quotes
+                open_quotes.symmetric_difference_update([token])
             else:
-                text = text.rstrip() + f'{token} '
+                closing = is_punctuation(token) and \
+                    token not in OPENING_PUNCTUATION and token not in DASHES
 
-        return text.rstrip()
+            if parts and not (attach or closing):
+                parts.append(' ')
+            parts.append(token)
+
+            attach = token in OPENING_PUNCTUATION or \
+                (token in QUOTES and not closing)
+
+        return ''.join(parts)
 
     @staticmethod
     def string_to_list(text):
         """
         recebe uma string e devolve uma lista de tokens
         """
-        return word_tokenize(text)
\ No newline at end of file
+        return word_tokenize(text)
+
+    @staticmethod
+    def list_to_tokens(token_list):
+        """
+        Recebe uma lista de tokens ou sentenças e devolve uma lista de tokens
+        sem reconstruir o texto: itens que já são tokens (palavras ou
+        pontuações) são mantidos e somente os demais são atomizados.
+
+        param : token_list : <list>
+        return : <list>
+        """
+        tokens = []
+        for item in token_list:
+            if item.isalnum() or is_punctuation(item):
+                tokens.append(item)
+            else:
+                tokens.extend(word_tokenize(item))
+
+        return tokens
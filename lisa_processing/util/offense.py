@@ -0,0 +1,141 @@
+"""
+Módulo dedicado à identificação de termos ofensivos do hateset.
+
+Os termos de uma palavra são buscados pelo radical no índice do hateset,
+enquanto as expressões de mais de uma palavra (Ex: filho da puta, arma de
+fogo) são compiladas uma única vez em um autômato de Aho-Corasick sobre os
+radicais, de forma que todas as ocorrências de um texto sejam identificadas
+em uma única passada.
+
+Os radicais das expressões também são gravados no artefato compilado
+(`manage.py compile_lexicon`), na tabela `expressions`, cujas chaves
+combinam a expressão e seus radicais separados por tabulação
+(Ex: "arma de fogo\tarm de fog") e cujos valores são o número de tokens.
+"""
+from collections import namedtuple
+from nltk.stem import SnowballStemmer
+from lisa_processing.util.lexicon import CorpusIndex, get_hateset_index
+from lisa_processing.util.phrase_matcher import Match, PhraseMatcher
+
+OffenseIndex = namedtuple('OffenseIndex', ['stems', 'matcher'])
+
+
+def read_expressions(path):
+    """
+    Lê as expressões de mais de uma palavra do corpus hateset.txt.
+
+    param : path : <str>
+    return : <dict> : {<str> expressão: <tuple> de <str> radicais}
+    """
+    stemmer = SnowballStemmer('portuguese')
+    expressions = {}
+    with open(path) as f:
+        for row in f:
+            term = ' '.join(row.lower().split())
+            tokens = term.split()
+            if len(tokens) > 1:
+                expressions[term] = tuple(stemmer.stem(t) for t in tokens)
+
+    return expressions
+
+
+def compile_expressions(expressions):
+    """
+    Compila as expressões em um autômato sobre seus radicais.
+
+    param : expressions : <dict> : {<str> expressão: <tuple> radicais}
+    return : <PhraseMatcher>
+    """
+    matcher = PhraseMatcher()
+    for term, stems in expressions.items():
+        matcher.add(stems, key=term)
+
+    return matcher.compile()
+
+
+def build_expression_index(path):
+    """
+    Lê o corpus hateset.txt, compilando as expressões de mais de uma palavra
+    em um autômato sobre seus radicais.
+
+    param : path : <str>
+    return : <PhraseMatcher>
+    """
+    return compile_expressions(read_expressions(path))
+
+
+def build_expression_table(path):
+    """
+    Gera a tabela de expressões gravada no artefato compilado.
+
+    param : path : <str>
+    return : <dict> : {<str> "expressão\tradicais": <int> número de tokens}
+    """
+    return {
+        f'{term}\t{" ".join(stems)}': len(stems)
+        for term, stems in read_expressions(path).items()
+    }
+
+
+def load_expression_index(table):
+    """
+    Compila o autômato de expressões a partir da tabela do artefato, sem
+    ler ou stemizar o corpus novamente.
+
+    param : table : <StemTable>
+    return : <PhraseMatcher>
+    """
+    expressions = {}
+    for key in table:
+        term, stems = key.split('\t')
+        expressions[term] = tuple(stems.split(' '))
+
+    return compile_expressions(expressions)
+
+
+HATESET_EXPRESSIONS = CorpusIndex('hateset', build_expression_index,
+                                  table='expressions',
+                                  loader=load_expression_index)
+
+
+def get_offense_index():
+    """
+    Retorna o índice de termos ofensivos compartilhado pelo processo.
+
+    return : <OffenseIndex> : radicais (<frozenset>) e expressões
+                              (<PhraseMatcher>) do hateset
+    """
+    return OffenseIndex(get_hateset_index(), HATESET_EXPRESSIONS.get())
+
+
+def scan_offenses(stems, skip=None, index=None):
+    """
+    Identifica os termos ofensivos em uma sequência de radicais.
+
+    Um token é ofensivo quando seu radical consta no hateset ou quando faz
+    parte de uma expressão do hateset. Tokens marcados em `skip` (stop words
+    e pontuações) nunca são ofensivos por si só, mas compõem expressões.
+
+    param : stems : <list> de <str> : radicais dos tokens
+    param : skip : <list> de <bool> : tokens ignorados
+    param : index : <OffenseIndex>
+    return : <tuple> : (<list> de <bool> por token,
+                        <list> de <Match> com as posições dos termos)
+    """
+    index = index or get_offense_index()
+    skip = skip or [False] * len(stems)
+
+    matches = [
+        Match(stem, position, position + 1)
+        for position, (stem, skipped) in enumerate(zip(stems, skip))
+        if not skipped and stem in index.stems
+    ]
+    matches.extend(index.matcher.iter_matches(stems))
+    matches.sort(key=lambda match: (match.start, match.end))
+
+    flags = [False] * len(stems)
+    for match in matches:
+        for position in range(match.start, match.end):
+            flags[position] = not skip[position]
+
+    return flags, matches
@@ -0,0 +1,179 @@
+"""
+Módulo dedicado à busca de expressões (n-gramas de tokens) em textos.
+
+As expressões são compiladas uma única vez em um autômato de Aho-Corasick
+sobre tokens: uma trie de expressões com ligações de falha, de forma que a
+varredura de um texto seja linear no número de tokens, independentemente do
+número e do tamanho das expressões buscadas.
+"""
+from collections import deque, namedtuple
+from functools import lru_cache
+
+# Ocorrência de uma expressão: índices dos tokens [start, end)
+Match = namedtuple('Match', ['phrase', 'start', 'end'])
+
+DEFAULT_CACHE_SIZE = 32
+
+
+class PhraseMatcher:
+    """
+    Autômato de Aho-Corasick sobre tokens.
+
+    As expressões podem ser fornecidas como texto, atomizado pelo
+    `tokenizer`, ou como sequências de tokens. Cada expressão é identificada
+    nas ocorrências pela sua chave, por padrão a própria expressão.
+
+    Exemplo:
+        >>> matcher = PhraseMatcher(['bom dia', 'dia'])
+        >>> matcher.find('um bom dia'.split())
+        [Match(phrase='bom dia', start=1, end=3), Match(phrase='dia', ...)]
+
+    param : phrases : <iterable> de <str> ou <tuple>
+    param : tokenizer : <callable> : atomizador das expressões em texto
+    param : lowercase : <bool> : ignora a caixa das expressões e dos tokens
+    """
+    def __init__(self, phrases=(), tokenizer=str.split, lowercase=False):
+        self.tokenizer = tokenizer
+        self.lowercase = lowercase
+        self._goto = [{}]
+        self._fail = [0]
+        # Expressões que terminam em cada estado e, após a compilação, essas
+        # somadas às herdadas dos sufixos
+        self._own_outputs = [()]
+        self._outputs = [()]
+        self._compiled = True
+
+        for phrase in phrases:
+            self.add(phrase)
+
+    def _normalize(self, token):
+        return token.lower() if self.lowercase else token
+
+    def add(self, phrase, key=None):
+        """
+        Adiciona uma expressão ao autômato.
+
+        param : phrase : <str> ou <tuple> de <str>
+        param : key : chave retornada nas ocorrências (padrão = phrase)
+        """
+        if isinstance(phrase, str):
+            tokens = self.tokenizer(phrase)
+        else:
+            tokens = phrase = tuple(phrase)
+
+        tokens = [self._normalize(token) for token in tokens]
+        if not tokens:
+            return
+
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._own_outputs.append(())
+            state = next_state
+
+        self._own_outputs[state] += (
+            (phrase if key is None else key, len(tokens)),
+        )
+        self._compiled = False
+
+    def compile(self):
+        """
+        Compila o autômato, caso haja expressões adicionadas desde a última
+        compilação. Útil para compilá-lo antecipadamente (Ex: antes do fork
+        dos workers), e não na primeira busca.
+
+        return : <PhraseMatcher>
+        """
+        if not self._compiled:
+            self._compile()
+
+        return self
+
+    def _compile(self):
+        """
+        Calcula as ligações de falha em largura, herdando as ocorrências
+        dos sufixos de cada estado. As ocorrências herdadas são sempre
+        recalculadas a partir das próprias de cada estado, de forma que o
+        autômato possa ser recompilado após novas adições.
+        """
+        self._fail = [0] * len(self._goto)
+        outputs = [tuple(dict.fromkeys(output)) for output in self._own_outputs]
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(token, 0)
+                self._fail[next_state] = fail
+                outputs[next_state] += outputs[fail]
+                queue.append(next_state)
+
+        self._outputs = outputs
+        self._compiled = True
+
+    def iter_matches(self, tokens):
+        """
+        Percorre os tokens uma única vez, gerando as ocorrências de todas as
+        expressões (inclusive sobrepostas) na ordem em que terminam.
+
+        param : tokens : <iterable> de <str>
+        return : <generator> de <Match>
+        """
+        self.compile()
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for index, token in enumerate(tokens):
+            token = self._normalize(token)
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+
+            for key, length in outputs[state]:
+                yield Match(key, index + 1 - length, index + 1)
+
+    def find(self, tokens):
+        """
+        Retorna todas as ocorrências das expressões nos tokens.
+
+        param : tokens : <iterable> de <str>
+        return : <list> de <Match>
+        """
+        return list(self.iter_matches(tokens))
+
+    def contains(self, tokens):
+        """
+        Verifica se alguma expressão ocorre nos tokens, interrompendo a
+        varredura na primeira ocorrência.
+
+        param : tokens : <iterable> de <str>
+        return : <bool>
+        """
+        return next(self.iter_matches(tokens), None) is not None
+
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def _compile_matcher(phrases, tokenizer, lowercase):
+    matcher = PhraseMatcher(phrases, tokenizer=tokenizer, lowercase=lowercase)
+    return matcher.compile()
+
+
+def get_phrase_matcher(phrases, tokenizer=str.split, lowercase=False):
+    """
+    Retorna o autômato compilado para a lista de expressões, reaproveitando
+    o autômato de chamadas anteriores com as mesmas expressões.
+
+    param : phrases : <iterable> de <str>
+    param : tokenizer : <callable>
+    param : lowercase : <bool>
+    return : <PhraseMatcher>
+    """
+    return _compile_matcher(frozenset(phrases), tokenizer, lowercase)
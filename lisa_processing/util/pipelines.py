@@ -15,8 +15,10 @@ class CustomPipeline:
     def execute_pre_processing(text, algorythms):
         """
         Passa uma entrada de texto por uma lista de algoritmos de pré-processamento.
+        Após a atomização, a lista de tokens (<TokenList>) é repassada entre os
+        estágios sem ser reatomizada.
 
-        param : text : <str> or <list>
+        param : text : <str>, <list> or <TokenList>
         algorythms : <list>
         return : <list>
         """
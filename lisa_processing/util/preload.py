@@ -0,0 +1,33 @@
+"""
+Módulo dedicado ao pré-carregamento dos recursos da API.
+
+Executado no processo mestre do gunicorn (preload_app), carrega o modelo do
+spaCy e os índices léxicos (inclusive o autômato de expressões ofensivas,
+já compilado) antes do fork, de forma que os workers compartilhem essas
+páginas de memória via copy-on-write.
+"""
+import logging
+from lisa_processing.util.language_model import get_language_model
+from lisa_processing.util.lexicon import get_hateset_index, get_polarity_index
+from lisa_processing.util.modifiers import get_modifiers
+from lisa_processing.util.offense import get_offense_index
+from lisa_processing.util.stopwords import get_stopwords
+
+logger = logging.getLogger('lisa')
+
+
+def preload(language_model=True):
+    """
+    Carrega os índices léxicos e, opcionalmente, o modelo do spaCy.
+
+    param : language_model : <bool>
+    """
+    logger.info('Preloading lexical indexes...')
+    get_polarity_index()
+    get_hateset_index()
+    get_offense_index()
+    get_modifiers()
+    get_stopwords().load()
+
+    if language_model:
+        get_language_model()
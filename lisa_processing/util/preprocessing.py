@@ -0,0 +1,75 @@
+"""
+Módulo dedicado ao pré-processamento compartilhado pelas funcionalidades
+léxicas.
+
+Cada texto é segmentado, atomizado, stemizado e anotado (pontuação e stop
+word) em uma única passada, produzindo um fluxo de tokens anotados que é
+consumido pelo classificador de sentimentos, pela medição de ofensa e pelas
+remoções de stop words e pontuações. O fluxo de cada texto é armazenado no
+cache da requisição, de forma que os resolvers de uma mesma query não
+reprocessem o mesmo texto.
+"""
+from collections import namedtuple
+from nltk import sent_tokenize, word_tokenize
+from lisa_processing.util.punctuation import is_punctuation
+from lisa_processing.util.request_cache import get_request_cache
+from lisa_processing.util.stemmer import get_stemmer
+from lisa_processing.util.stopwords import get_stopwords
+
+AnnotatedToken = namedtuple(
+    'AnnotatedToken',
+    ['surface', 'lower', 'stem', 'is_punct', 'is_stop', 'sentence']
+)
+
+
+def tokenize_sentences(text):
+    """
+    Segmenta o texto em sentenças e atomiza cada sentença.
+
+    param : text : <str>
+    return : <generator> de <tuple> : (<int> índice da sentença,
+                                       <list> de <str> tokens)
+    """
+    for index, sentence in enumerate(sent_tokenize(text)):
+        yield index, word_tokenize(sentence)
+
+
+def annotate(text):
+    """
+    Retorna o fluxo de tokens anotados do texto, processando-o somente se
+    ainda não tiver sido processado na requisição atual.
+
+    param : text : <str>
+    return : <tuple> de <AnnotatedToken>
+    """
+    cache = get_request_cache('preprocessing')
+    if cache is not None and text in cache:
+        return cache[text]
+
+    surfaces = []
+    sentences = []
+    for index, tokens in tokenize_sentences(text):
+        surfaces.extend(tokens)
+        sentences.extend([index] * len(tokens))
+
+    lowers = [surface.lower() for surface in surfaces]
+    stems = get_stemmer().stem_many(lowers)
+    stop_flags = get_stopwords().mask(surfaces)
+
+    annotated = tuple(
+        AnnotatedToken(
+            surface=surface,
+            lower=lower,
+            stem=stem,
+            is_punct=is_punctuation(surface),
+            is_stop=is_stop,
+            sentence=sentence
+        )
+        for surface, lower, stem, is_stop, sentence
+        in zip(surfaces, lowers, stems, stop_flags, sentences)
+    )
+
+    if cache is not None:
+        cache[text] = annotated
+
+    return annotated
@@ -0,0 +1,56 @@
+"""
+Módulo dedicado à identificação e remoção de pontuações.
+
+Considera como pontuação, além de `string.punctuation`, todos os caracteres
+Unicode do plano multilíngue básico da categoria P* (Ex: “ ” ‘ ’ « » – — …
+¿ ¡), frequentes em textos em português. O conjunto e a expressão regular de
+remoção são compilados uma única vez; as remoções são lineares no tamanho do
+texto.
+"""
+import re
+import unicodedata
+from string import punctuation
+
+PUNCTUATION = frozenset(punctuation) | frozenset(
+    char for char in map(chr, range(0x10000))
+    if unicodedata.category(char).startswith('P')
+)
+
+# Remove sequências de pontuações em uma única passada. Em textos com
+# acentos, re.sub é mais rápido que str.translate, cuja tabela de tradução
+# é consultada caractere a caractere fora do ASCII.
+PUNCTUATION_PATTERN = re.compile(
+    '[{}]+'.format(''.join(re.escape(char) for char in sorted(PUNCTUATION)))
+)
+
+
+def strip_punctuation(text):
+    """
+    Remove todas as pontuações do texto.
+
+    param : text : <str>
+    return : <str>
+    """
+    return PUNCTUATION_PATTERN.sub('', text)
+
+
+def is_punctuation(token):
+    """
+    Verifica se o token é composto somente de pontuações (Ex: '!', '...',
+    '“', '?!').
+
+    param : token : <str>
+    return : <bool>
+    """
+    return bool(token) and PUNCTUATION.issuperset(token)
+
+
+def remove_punctuation_tokens(tokens):
+    """
+    Remove os tokens compostos somente de pontuações (e tokens vazios).
+
+    param : tokens : <iterable> de <str>
+    return : <list> de <str>
+    """
+    return [token for token in tokens
+            if token and not PUNCTUATION.issuperset(token)]
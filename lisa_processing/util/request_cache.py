@@ -0,0 +1,40 @@
+"""
+Módulo dedicado ao cache com escopo de requisição.
+
+O middleware `RequestCacheMiddleware` ativa um cache vazio no início de cada
+requisição e o descarta ao final, permitindo que resultados intermediários
+(ex.: Docs do spaCy) sejam reaproveitados por todos os resolvers de uma
+mesma query sem vazar entre requisições.
+"""
+import threading
+
+_local = threading.local()
+
+
+def activate():
+    """
+    Ativa um cache vazio para a requisição da thread atual.
+    """
+    _local.cache = {}
+
+
+def deactivate():
+    """
+    Descarta o cache da requisição da thread atual.
+    """
+    _local.cache = None
+
+
+def get_request_cache(namespace):
+    """
+    Retorna o dicionário do namespace no cache da requisição atual, ou None
+    caso não haja uma requisição ativa (ex.: comandos e testes).
+
+    param : namespace : <str>
+    return : <dict> ou None
+    """
+    cache = getattr(_local, 'cache', None)
+    if cache is None:
+        return None
+
+    return cache.setdefault(namespace, {})
@@ -0,0 +1,221 @@
+"""
+Módulo dedicado à classificação de sentimentos em lote.
+
+Implementa o mesmo algoritmo léxico de `nlp.text_classifier` (Taboada et al.,
+2011) sobre um lote de textos: os textos são atomizados uma única vez, cada
+token distinto recebe um identificador inteiro (e é stemizado uma única vez)
+e as polaridades, modificadores e médias são calculados com operações
+vetorizadas do NumPy.
+
+Lotes grandes podem, opcionalmente, ser fragmentados entre os processos de um
+pool persistente (settings.SENTIMENT_BATCH).
+"""
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+import numpy as np
+from django.conf import settings
+from lisa_processing.util.modifiers import (INTENSIFIER, NEGATION, REDUCER,
+                                            get_modifiers)
+from lisa_processing.util.nlp import (get_pols_from_corpus, remove_punctuations,
+                                      stemming)
+from lisa_processing.util.preprocessing import tokenize_sentences
+
+logger = logging.getLogger('lisa')
+
+DEFAULT_BATCH_CONFIG = {
+    'PARALLEL': False,
+    'WORKERS': None,
+    'CHUNK_SIZE': 2000,
+    'THRESHOLD': 10000,
+}
+
+
+def _encode(texts):
+    """
+    Atomiza os textos, retornando os identificadores de cada token, o índice
+    da sentença de cada token, o índice do texto de cada sentença, o tamanho
+    da última sentença de cada texto e o vocabulário (token -> id).
+    """
+    vocabulary = {}
+    token_ids = []
+    token_sentences = []
+    sentence_texts = []
+    last_sentence_sizes = []
+
+    for text_index, text in enumerate(texts):
+        last_size = 0
+        for _, tokens in tokenize_sentences(text):
+            sentence_index = len(sentence_texts)
+            sentence_texts.append(text_index)
+
+            tokens = remove_punctuations(tokens)
+            for token in tokens:
+                token = token.lower()
+                token_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+                token_sentences.append(sentence_index)
+            last_size = len(tokens)
+
+        last_sentence_sizes.append(last_size)
+
+    return (
+        np.array(token_ids, dtype=np.intp),
+        np.array(token_sentences, dtype=np.intp),
+        np.array(sentence_texts, dtype=np.intp),
+        last_sentence_sizes,
+        vocabulary
+    )
+
+
+def classify_batch(texts, strict=True):
+    """
+    Classifica o sentimento de cada texto do lote, retornando os mesmos
+    valores que `text_classifier` retornaria para cada texto.
+
+    param : texts : <list> : lista de textos (<str>)
+    param : strict : <bool> : se True, textos sem tokens classificáveis
+                              lançam ZeroDivisionError (assim como em
+                              `text_classifier`), caso contrário resultam
+                              em None.
+    return : <list> de <float>
+    """
+    if not texts:
+        return []
+
+    corpus = get_pols_from_corpus()
+    modifier_flags = get_modifiers().flags
+
+    token_ids, token_sentences, sentence_texts, last_sizes, vocabulary = \
+        _encode(texts)
+
+    # Cada token distinto é stemizado e consultado nos léxicos uma única vez
+    stems = stemming(list(vocabulary))
+    vocabulary_polarity = np.array(
+        [corpus.get(stem, 0) for stem in stems], dtype=np.float64
+    )
+    vocabulary_flags = np.array(
+        [modifier_flags.get(stem, 0) for stem in stems], dtype=np.int8
+    )
+
+    # Identifica os modificadores de cada sentença
+    num_sentences = len(sentence_texts)
+    token_flags = vocabulary_flags[token_ids]
+
+    def sentence_has(flag):
+        counts = np.bincount(
+            token_sentences,
+            weights=(token_flags & flag) > 0,
+            minlength=num_sentences
+        )
+        return counts > 0
+
+    is_intensified = sentence_has(INTENSIFIER)
+    has_negation = sentence_has(NEGATION)
+    is_reduced = sentence_has(REDUCER)
+
+    # Intensificadores triplicam a polaridade (ou a reduzem, se negados),
+    # redutores a reduzem (ou a triplicam, se negados)
+    multiply = (is_intensified & ~has_negation) | \
+               (~is_intensified & is_reduced & has_negation)
+    divide = (is_intensified & has_negation) | \
+             (~is_intensified & is_reduced & ~has_negation)
+
+    token_polarity = vocabulary_polarity[token_ids]
+    token_polarity = token_polarity * np.where(multiply, 3, 1)[token_sentences]
+    token_polarity = token_polarity / np.where(divide, 3, 1)[token_sentences]
+
+    # A polaridade do texto é a média de sentimento de seus tokens
+    token_texts = sentence_texts[token_sentences]
+    totals = np.bincount(token_texts, weights=token_polarity,
+                         minlength=len(texts))
+    counts = np.bincount(token_texts, minlength=len(texts))
+
+    empty = counts == 0
+    if strict and empty.any():
+        raise ZeroDivisionError('Text without classifiable tokens.')
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        text_sentiment = (totals / counts) * 100
+
+    bias = np.array([float(f'.{size}') - 0.1 for size in last_sizes])
+    sentiments = np.minimum((text_sentiment * .01) + bias, 1)
+
+    return [
+        None if is_empty else sentiment
+        for sentiment, is_empty in zip(sentiments.tolist(), empty.tolist())
+    ]
+
+
+def get_batch_config():
+    """
+    Retorna a configuração de execução dos lotes, definida em
+    settings.SENTIMENT_BATCH.
+
+    return : <dict>
+    """
+    return {**DEFAULT_BATCH_CONFIG, **getattr(settings, 'SENTIMENT_BATCH', {})}
+
+
+_executor_lock = threading.Lock()
+_executor = None
+
+
+def get_executor():
+    """
+    Retorna o pool de processos persistente utilizado nos lotes grandes.
+
+    Os léxicos são carregados antes da criação do pool, de forma que os
+    processos (criados via fork) já os herdem carregados.
+
+    return : <ProcessPoolExecutor>
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            get_pols_from_corpus()
+            get_modifiers()
+            _executor = ProcessPoolExecutor(
+                max_workers=get_batch_config()['WORKERS']
+            )
+
+    return _executor
+
+
+def shutdown_executor():
+    """
+    Encerra o pool de processos, se existente.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def classify_texts(texts, strict=True):
+    """
+    Classifica o sentimento de cada texto, fragmentando o lote entre os
+    processos do pool quando a execução paralela estiver habilitada e o lote
+    atingir o limite configurado. Lotes menores permanecem no processo atual.
+
+    param : texts : <list> : lista de textos (<str>)
+    param : strict : <bool> : ver `classify_batch`
+    return : <list> de <float>
+    """
+    config = get_batch_config()
+    if not config['PARALLEL'] or len(texts) < config['THRESHOLD']:
+        return classify_batch(texts, strict=strict)
+
+    chunk_size = config['CHUNK_SIZE']
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    try:
+        results = get_executor().map(
+            partial(classify_batch, strict=strict), chunks
+        )
+        return [sentiment for chunk in results for sentiment in chunk]
+    except BrokenProcessPool:
+        logger.exception('Sentiment process pool is broken, running inline.')
+        shutdown_executor()
+        return classify_batch(texts, strict=strict)
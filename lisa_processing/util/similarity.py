@@ -0,0 +1,178 @@
+"""
+Módulo dedicado ao cálculo de similaridade entre textos.
+
+Os vetores dos textos são normalizados (norma L2) e mantidos em um cache LRU
+do processo, de forma que a similaridade do cosseno se reduza a um produto
+escalar: a matriz de similaridade de N textos é um único produto matricial e
+a busca pelos K termos mais similares a um texto é uma ordenação parcial
+sobre um índice pré-computado (corpus ou vocabulário do modelo).
+"""
+import threading
+import numpy as np
+from django.conf import settings
+from lisa_processing.util.documents import TAGGER, get_docs
+from lisa_processing.util.language_model import get_language_model
+from lisa_processing.util.lexicon import CorpusIndex
+from lisa_processing.util.lru import LRUCache
+
+DEFAULT_VECTOR_CACHE_SIZE = 1024
+
+
+def normalize(vectors):
+    """
+    Normaliza os vetores (linhas) pela norma L2. Vetores nulos permanecem
+    nulos, resultando em similaridade 0.
+
+    param : vectors : <numpy.ndarray> : matriz (n, dimensão)
+    return : <numpy.ndarray>
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+
+    return vectors / norms
+
+
+_lock = threading.Lock()
+_vector_cache = None
+
+
+def get_vector_cache():
+    """
+    Retorna o cache LRU de vetores normalizados do processo.
+
+    return : <LRUCache>
+    """
+    global _vector_cache
+    with _lock:
+        if _vector_cache is None:
+            _vector_cache = LRUCache(getattr(
+                settings, 'SIMILARITY_VECTOR_CACHE_SIZE',
+                DEFAULT_VECTOR_CACHE_SIZE
+            ))
+
+    return _vector_cache
+
+
+def text_vectors(texts):
+    """
+    Retorna a matriz de vetores normalizados dos textos, processando com o
+    spaCy somente os textos ainda não presentes no cache.
+
+    param : texts : <list> de <str>
+    return : <numpy.ndarray> : matriz (n, dimensão)
+    """
+    cache = get_vector_cache()
+    vectors = {}
+    for text in texts:
+        vector = cache.get(text)
+        if vector is not None:
+            vectors[text] = vector
+
+    missing = list(dict.fromkeys(t for t in texts if t not in vectors))
+    if missing:
+        docs = get_docs(get_language_model(), missing, TAGGER)
+        for text, vector in zip(missing, normalize([d.vector for d in docs])):
+            vectors[text] = vector
+            cache.set(text, vector)
+
+    return np.vstack([vectors[text] for text in texts])
+
+
+def similarity_matrix(texts):
+    """
+    Calcula a similaridade do cosseno entre todos os pares de textos.
+    Textos idênticos possuem similaridade 1, assim como em Doc.similarity.
+
+    param : texts : <list> de <str>
+    return : <numpy.ndarray> : matriz (n, n)
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    vectors = text_vectors(texts)
+    matrix = vectors @ vectors.T
+
+    _, ids = np.unique(texts, return_inverse=True)
+    matrix[ids[:, None] == ids[None, :]] = 1
+
+    return matrix
+
+
+def similarity(first, second):
+    """
+    Calcula a similaridade do cosseno entre dois textos.
+
+    param : first : <str>
+    param : second : <str>
+    return : <float>
+    """
+    return float(similarity_matrix([first, second])[0, 1])
+
+
+def build_corpus_index(path):
+    """
+    Constrói o índice de busca a partir de um corpus com um texto por linha.
+
+    param : path : <str>
+    return : <tuple> : (<list> textos, <numpy.ndarray> vetores normalizados)
+    """
+    with open(path) as f:
+        texts = [row.strip() for row in f if row.strip()]
+
+    docs = get_docs(get_language_model(), texts, TAGGER)
+    return texts, normalize([doc.vector for doc in docs])
+
+
+CORPUS_INDEX = CorpusIndex('motivational', build_corpus_index)
+
+_vocabulary_index = {}
+
+
+def get_vocabulary_index():
+    """
+    Retorna o índice de busca construído a partir dos vetores do vocabulário
+    do modelo. Modelos sem vetores resultam em um índice vazio.
+
+    return : <tuple> : (<list> termos, <numpy.ndarray> vetores normalizados)
+    """
+    nlp = get_language_model()
+    with _lock:
+        if nlp not in _vocabulary_index:
+            vectors = nlp.vocab.vectors
+            keys, rows = [], []
+            for key, row in vectors.key2row.items():
+                keys.append(nlp.vocab.strings[key])
+                rows.append(row)
+            data = normalize(vectors.data[rows]) if rows else \
+                np.zeros((0, vectors.shape[1]), dtype=np.float32)
+            _vocabulary_index[nlp] = (keys, data)
+
+    return _vocabulary_index[nlp]
+
+
+def most_similar(text, k=10, source='corpus'):
+    """
+    Busca os K termos do índice mais similares ao texto.
+
+    param : text : <str>
+    param : k : <int>
+    param : source : <str> : 'corpus' ou 'vocabulary'
+    return : <list> de <dict> : ordenada da maior para a menor similaridade
+    """
+    if source == 'vocabulary':
+        terms, vectors = get_vocabulary_index()
+    else:
+        terms, vectors = CORPUS_INDEX.get()
+
+    k = min(k, len(terms))
+    if k <= 0:
+        return []
+
+    scores = vectors @ text_vectors([text])[0]
+
+    # Ordenação parcial: somente os K melhores são ordenados
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = best[np.argsort(-scores[best])]
+
+    return [{'term': terms[i], 'similarity': float(scores[i])} for i in best]
@@ -0,0 +1,86 @@
+"""
+Módulo dedicado ao serviço de stemming compartilhado pelo processo.
+
+O vocabulário das requisições segue uma distribuição de Zipf, portanto os
+radicais são memorizados em um cache LRU limitado: palavras repetidas custam
+apenas uma consulta ao cache.
+"""
+import threading
+from functools import lru_cache
+from nltk.stem import SnowballStemmer
+from django.conf import settings
+
+DEFAULT_CACHE_SIZE = 65536
+
+
+class StemmerService:
+    """
+    Stemmer Snowball com cache LRU limitado e seguro entre threads.
+
+    param : language : <str>
+    param : maxsize : <int> : número máximo de palavras memorizadas
+    """
+    def __init__(self, language='portuguese', maxsize=DEFAULT_CACHE_SIZE):
+        self._stemmer = SnowballStemmer(language)
+        self._cached_stem = lru_cache(maxsize=maxsize)(self._stemmer.stem)
+
+    def stem(self, word):
+        """
+        Retorna o radical de uma palavra.
+
+        param : word : <str>
+        return : <str>
+        """
+        return self._cached_stem(word)
+
+    def stem_many(self, tokens):
+        """
+        Retorna o radical de cada token fornecido, preservando a ordem.
+
+        param : tokens : <list>
+        return : <list>
+        """
+        stem = self._cached_stem
+        return [stem(token) for token in tokens]
+
+    def info(self):
+        """
+        Retorna as estatísticas do cache.
+
+        return : <dict>
+        """
+        info = self._cached_stem.cache_info()
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'maxsize': info.maxsize,
+            'size': info.currsize
+        }
+
+    def clear(self):
+        """
+        Esvazia o cache e zera as estatísticas.
+        """
+        self._cached_stem.cache_clear()
+
+
+_lock = threading.Lock()
+_service = None
+
+
+def get_stemmer():
+    """
+    Retorna o serviço de stemming compartilhado pelo processo, cujo tamanho
+    do cache é definido em settings.STEMMER_CACHE_SIZE.
+
+    return : <StemmerService>
+    """
+    global _service
+    if _service is None:
+        with _lock:
+            if _service is None:
+                _service = StemmerService(maxsize=getattr(
+                    settings, 'STEMMER_CACHE_SIZE', DEFAULT_CACHE_SIZE
+                ))
+
+    return _service
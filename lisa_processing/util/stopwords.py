@@ -0,0 +1,144 @@
+"""
+Módulo dedicado ao registro de stop words (palavras vazias).
+
+As stop words do NLTK são carregadas uma única vez por processo em um
+conjunto imutável, acrescido das adições e remoções customizadas de cada
+implantação, definidas no arquivo settings.STOPWORDS_CUSTOM_PATH:
+
+    # comentário
+    +vc        (adiciona "vc")
+    tb         (adiciona "tb")
+    -não       (remove "não")
+"""
+import threading
+from django.conf import settings
+from nltk.corpus import stopwords
+
+
+def read_custom_stopwords(path):
+    """
+    Lê o arquivo de stop words customizadas.
+
+    param : path : <str>
+    return : <tuple> : (<set> adições, <set> remoções)
+    """
+    additions, removals = set(), set()
+    with open(path) as f:
+        for row in f:
+            row = row.strip()
+            if not row or row.startswith('#'):
+                continue
+            if row.startswith('-'):
+                removals.add(row[1:].strip())
+            else:
+                additions.add(row.lstrip('+').strip())
+
+    return additions, removals
+
+
+class StopwordRegistry:
+    """
+    Conjunto imutável de stop words de um idioma, carregado no primeiro uso.
+
+    param : language : <str> : idioma do corpus de stop words do NLTK
+    param : custom_path : <str> : arquivo de adições e remoções (opcional)
+    """
+    def __init__(self, language='portuguese', custom_path=None):
+        self.language = language
+        self.custom_path = custom_path
+        self._lock = threading.Lock()
+        self._words = None
+
+    @property
+    def words(self):
+        """
+        return : <frozenset>
+        """
+        words = self._words
+        if words is None:
+            words = self.load()
+
+        return words
+
+    def load(self):
+        """
+        Carrega o conjunto de stop words, caso ainda não tenha sido
+        carregado. Pode ser chamado antecipadamente (Ex: no preload).
+
+        return : <frozenset>
+        """
+        with self._lock:
+            if self._words is None:
+                self._words = self.read()
+
+            return self._words
+
+    def read(self):
+        """
+        Lê as stop words do NLTK, aplicando as customizações.
+
+        return : <frozenset>
+        """
+        words = set(stopwords.words(self.language))
+        if self.custom_path:
+            additions, removals = read_custom_stopwords(self.custom_path)
+            words = (words | additions) - removals
+
+        return frozenset(words)
+
+    def clear(self):
+        """
+        Descarta o conjunto carregado, que será recarregado no próximo uso.
+        """
+        with self._lock:
+            self._words = None
+
+    def __contains__(self, token):
+        return token in self.words
+
+    def filter(self, tokens):
+        """
+        Remove as stop words dos tokens.
+
+        param : tokens : <iterable> de <str>
+        return : <list> de <str>
+        """
+        words = self.words
+        return [token for token in tokens if token not in words]
+
+    def mask(self, tokens):
+        """
+        Retorna a máscara booleana das stop words, alinhada aos tokens.
+
+        Exemplo:
+            >>> registry.mask(['o', 'rato'])
+            [True, False]
+
+        param : tokens : <iterable> de <str>
+        return : <list> de <bool>
+        """
+        words = self.words
+        return [token in words for token in tokens]
+
+
+_lock = threading.Lock()
+_registry = None
+
+
+def get_stopwords():
+    """
+    Retorna o registro de stop words em português compartilhado pelo
+    processo.
+
+    return : <StopwordRegistry>
+    """
+    global _registry
+    if _registry is None:
+        with _lock:
+            if _registry is None:
+                _registry = StopwordRegistry(
+                    'portuguese',
+                    getattr(settings, 'STOPWORDS_CUSTOM_PATH', None)
+                )
+
+    return _registry
@@ -1,6 +1,9 @@
 """
 Módulo dedicao à implementação de outras ferramentas diversas.
 """
+import resource
+from graphene.utils.str_converters import to_snake_case
+from graphql.language import ast
 
 
 def get_pos_tag_description(tag):
@@ -69,3 +72,91 @@ def get_entity_description(entity):
     }
 
     return ent_map.get(entity, entity)
+
+
+def read_smaps_rollup(path='/proc/self/smaps_rollup'):
+    """
+    Lê os totais de memória do processo em /proc/<pid>/smaps_rollup.
+
+    param : path : <str>
+    return : <dict> : {<str> campo: <int> bytes}
+    """
+    usage = {}
+    with open(path) as f:
+        for row in f:
+            name, _, value = row.partition(':')
+            value = value.split()
+            if len(value) == 2 and value[1] == 'kB':
+                usage[name] = int(value[0]) * 1024
+
+    return usage
+
+
+def get_memory_usage():
+    """
+    Retorna o uso de memória do processo atual, em bytes:
+        - rss : memória residente;
+        - pss : memória proporcional, em que cada página compartilhada é
+                dividida entre os processos que a compartilham;
+        - shared : páginas compartilhadas com outros processos, inclusive as
+                   anônimas herdadas via copy-on-write do processo pai;
+        - private : páginas exclusivas do processo (USS).
+
+    Fora do Linux (ou sem smaps_rollup) somente o pico de memória residente
+    é conhecido, e os demais valores são None.
+
+    return : <dict>
+    """
+    try:
+        usage = read_smaps_rollup()
+    except OSError:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        return {'rss': rss, 'pss': None, 'shared': None, 'private': None}
+
+    return {
+        'rss': usage.get('Rss', 0),
+        'pss': usage.get('Pss', 0),
+        'shared': usage.get('Shared_Clean', 0) + usage.get('Shared_Dirty', 0),
+        'private': usage.get('Private_Clean', 0) + usage.get('Private_Dirty', 0)
+    }
+
+
+def get_selected_fields(info, path=()):
+    """
+    Retorna os nomes (em snake_case) dos campos selecionados pelo cliente no
+    campo sendo resolvido, incluindo os selecionados através de fragmentos.
+    Os campos de um subcampo podem ser obtidos informando seu caminho.
+
+    Exemplo: get_selected_fields(info, ('token_inspection',))
+
+    param : info : <graphql.execution.base.ResolveInfo>
+    param : path : <tuple> de <str> : caminho (snake_case) até o subcampo
+    return : <set> de <str>
+    """
+    def collect(selection_set):
+        if selection_set is None:
+            return
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.FragmentSpread):
+                yield from collect(
+                    info.fragments[selection.name.value].selection_set
+                )
+            elif isinstance(selection, ast.InlineFragment):
+                yield from collect(selection.selection_set)
+            else:
+                yield selection
+
+    selection_sets = [field.selection_set for field in info.field_asts]
+    for name in path:
+        selection_sets = [
+            field.selection_set
+            for selection_set in selection_sets
+            for field in collect(selection_set)
+            if to_snake_case(field.name.value) == name
+        ]
+
+    return {
+        to_snake_case(field.name.value)
+        for selection_set in selection_sets
+        for field in collect(selection_set)
+    }
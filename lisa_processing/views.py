@@ -0,0 +1,71 @@
+"""
+Views HTTP que complementam o endpoint GraphQL.
+"""
+import json
+import itertools
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.views.decorators.http import require_POST
+from lisa_processing.util.nlp import get_offense_level
+from lisa_processing.util.sentiment import classify_batch
+
+DEFAULT_STREAM_CHUNK_SIZE = 256
+
+
+def read_texts(request):
+    """
+    Lê o corpo da requisição linha a linha, retornando os textos não vazios.
+
+    Bytes inválidos em UTF-8 são substituídos (U+FFFD), uma vez que a leitura
+    ocorre durante o streaming, quando o status da resposta já foi enviado.
+
+    param : request : <HttpRequest> ou <iterable> de <bytes>
+    return : <generator> de <str>
+    """
+    for line in request:
+        text = line.decode('utf-8', errors='replace').strip()
+        if text:
+            yield text
+
+
+def score_texts(texts, chunk_size):
+    """
+    Pontua os textos incrementalmente, em blocos de `chunk_size` textos,
+    produzindo uma linha NDJSON por texto.
+
+    param : texts : <iterable> de <str>
+    param : chunk_size : <int>
+    return : <generator> de <bytes>
+    """
+    texts = iter(texts)
+    while True:
+        chunk = list(itertools.islice(texts, chunk_size))
+        if not chunk:
+            break
+
+        sentiments = classify_batch(chunk, strict=False)
+        for text, sentiment in zip(chunk, sentiments):
+            is_offensive, average = get_offense_level(text)
+            result = {
+                'text': text,
+                'sentiment': sentiment,
+                'is_offensive': is_offensive,
+                'offense_average': average
+            }
+            yield json.dumps(result, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+@require_POST
+def stream_scores(request):
+    """
+    Recebe textos delimitados por quebra de linha e retorna, em streaming,
+    o sentimento e o nível ofensivo de cada texto no formato NDJSON, com uso
+    de memória limitado ao tamanho do bloco processado.
+    """
+    chunk_size = getattr(
+        settings, 'STREAM_CHUNK_SIZE', DEFAULT_STREAM_CHUNK_SIZE
+    )
+    return StreamingHttpResponse(
+        score_texts(read_texts(request), chunk_size),
+        content_type='application/x-ndjson'
+    )